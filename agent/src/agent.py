@@ -1,6 +1,7 @@
 from typing import Dict, Any, Optional
 from mcp_client import MCPClient
 from tool_registry import ToolRegistry
+from tool_result import ToolResult
 
 class MCPAgent:
     """MCP Agent that discovers and executes tools."""
@@ -15,13 +16,20 @@ class MCPAgent:
         tools_list = tools_response.get("tools", [])
         self.tool_registry.register_tools_from_list(tools_list)
     
-    async def execute_tool(self, tool_name: str, parameters: Dict[str, Any]) -> Any:
-        """Execute a tool with given parameters."""
+    async def execute_tool(self, tool_name: str, parameters: Dict[str, Any], decode: bool = False) -> Any:
+        """Execute a tool with given parameters.
+        
+        With `decode` set, the raw result is wrapped in a ToolResult that decodes
+        structured and binary content lazily.
+        """
         if not self.tool_registry.is_tool_registered(tool_name):
             raise ValueError(f"Tool '{tool_name}' is not registered")
         
         tool_info = self.tool_registry.get_tool(tool_name)
-        return await self.mcp_client.call_tool(tool_name, parameters)
+        result = await self.mcp_client.call_tool(tool_name, parameters)
+        if decode:
+            return ToolResult(result)
+        return result
     
     async def list_available_tools(self) -> list[str]:
         """List all available tools."""
@@ -31,6 +39,15 @@ class MCPAgent:
         """Get information about a specific tool."""
         return self.tool_registry.get_tool(tool_name)
     
+    async def list_prompts(self) -> list[Dict[str, Any]]:
+        """List prompts available on the MCP server."""
+        prompts_response = await self.mcp_client.list_prompts()
+        return prompts_response.get("prompts", [])
+    
+    async def get_prompt(self, prompt_name: str, arguments: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Render a prompt with the given arguments."""
+        return await self.mcp_client.get_prompt(prompt_name, arguments)
+    
     async def close(self) -> None:
         """Close the agent and cleanup resources."""
         await self.mcp_client.close()
\ No newline at end of file
@@ -0,0 +1,163 @@
+import asyncio
+import math
+from collections import deque
+from typing import Deque, Dict, Optional
+
+class LatencyTracker:
+    """Sliding window of recent successful request latencies."""
+
+    def __init__(self, window_size: int = 200, min_samples: int = 20):
+        self.min_samples = min_samples
+        self._samples: Deque[float] = deque(maxlen=window_size)
+
+    def record(self, latency: float) -> None:
+        """Record a request latency in seconds."""
+        self._samples.append(latency)
+
+    def percentile(self, percentile: float) -> Optional[float]:
+        """Get a latency percentile, or None until enough samples are collected."""
+        if len(self._samples) < self.min_samples:
+            return None
+        ordered = sorted(self._samples)
+        index = min(len(ordered) - 1, math.ceil(percentile / 100 * len(ordered)) - 1)
+        return ordered[max(0, index)]
+
+    def __len__(self) -> int:
+        return len(self._samples)
+
+class RetryBudget:
+    """Caps retries and hedges to a fraction of regular requests.
+
+    Every request deposits `ratio` tokens and every retry or hedge withdraws a
+    whole token, so extra attempts can never exceed that share of traffic.
+    """
+
+    def __init__(self, ratio: float = 0.1, max_tokens: float = 10.0):
+        self.ratio = ratio
+        self.max_tokens = max_tokens
+        self.tokens = max_tokens
+
+    def deposit(self) -> None:
+        """Credit the budget for a regular request."""
+        self.tokens = min(self.max_tokens, self.tokens + self.ratio)
+
+    def try_withdraw(self) -> bool:
+        """Spend one token for a retry or hedge if available."""
+        if self.tokens < 1:
+            return False
+        self.tokens -= 1
+        return True
+
+class LatencyGradient:
+    """Short- and long-term exponentially weighted latency averages for one key."""
+
+    def __init__(self, short_alpha: float = 0.1, long_alpha: float = 0.002):
+        self.short_alpha = short_alpha
+        self.long_alpha = long_alpha
+        self.short: Optional[float] = None
+        self.long: Optional[float] = None
+        self.samples = 0
+
+    def record(self, latency: float) -> None:
+        """Fold a latency sample into both averages."""
+        self.samples += 1
+        if self.short is None:
+            self.short = self.long = latency
+            return
+        self.short += self.short_alpha * (latency - self.short)
+        self.long += self.long_alpha * (latency - self.long)
+
+    def ratio(self) -> float:
+        """Short-term over long-term average; above 1 means latency is rising."""
+        if not self.long:
+            return 1.0
+        return self.short / self.long
+
+class AdaptiveConcurrencyLimiter:
+    """AIMD limit on the number of in-flight requests.
+
+    The limit grows by roughly one per window of successful requests. It is
+    multiplied by `backoff_ratio` on errors, or when the short-term average
+    latency of a request kind rises above `latency_tolerance` times its
+    long-term average. Averages are kept per latency key so fast and slow
+    methods are never compared with each other, and the limit is cut at most
+    once per window of completions so one slow spell only counts once.
+    """
+
+    def __init__(self, initial_limit: int = 20, min_limit: int = 1, max_limit: int = 200,
+                 backoff_ratio: float = 0.9, latency_tolerance: float = 2.0,
+                 min_samples: int = 20):
+        self.limit = float(initial_limit)
+        self.min_limit = min_limit
+        self.max_limit = max_limit
+        self.backoff_ratio = backoff_ratio
+        self.latency_tolerance = latency_tolerance
+        self.min_samples = min_samples
+        self.inflight = 0
+        self._gradients: Dict[str, LatencyGradient] = {}
+        # Allow the first decrease without waiting for a full window
+        self._since_decrease = initial_limit
+        self._waiters: Deque[asyncio.Future] = deque()
+
+    def _has_capacity(self) -> bool:
+        return self.inflight < max(self.min_limit, int(self.limit))
+
+    def try_acquire(self) -> bool:
+        """Take a slot without waiting."""
+        if self._waiters or not self._has_capacity():
+            return False
+        self.inflight += 1
+        return True
+
+    async def acquire(self) -> None:
+        """Wait for a free slot."""
+        if self.try_acquire():
+            return
+
+        waiter = asyncio.get_running_loop().create_future()
+        self._waiters.append(waiter)
+        try:
+            await waiter
+        except asyncio.CancelledError:
+            if waiter.done() and not waiter.cancelled():
+                # The slot was handed over just before cancellation
+                self.inflight -= 1
+                self._wake_waiters()
+            elif waiter in self._waiters:
+                # A release may already have popped the cancelled waiter
+                self._waiters.remove(waiter)
+            raise
+
+    def release(self, latency: Optional[float] = None, error: bool = False,
+                key: Optional[str] = None) -> None:
+        """Free a slot and adjust the limit from the request outcome.
+
+        Latency only adjusts the limit when a `key` naming the request kind is
+        given. Pass no latency and no error for requests that were abandoned
+        or should not influence the limit.
+        """
+        self.inflight -= 1
+        self._since_decrease += 1
+        if error:
+            self._decrease()
+        elif latency is not None and key is not None:
+            gradient = self._gradients.setdefault(key, LatencyGradient())
+            gradient.record(latency)
+            if gradient.samples >= self.min_samples and gradient.ratio() > self.latency_tolerance:
+                self._decrease()
+            else:
+                self.limit = min(self.max_limit, self.limit + 1 / self.limit)
+        self._wake_waiters()
+
+    def _decrease(self) -> None:
+        if self._since_decrease < self.limit:
+            return
+        self._since_decrease = 0
+        self.limit = max(self.min_limit, self.limit * self.backoff_ratio)
+
+    def _wake_waiters(self) -> None:
+        while self._waiters and self._has_capacity():
+            waiter = self._waiters.popleft()
+            if not waiter.done():
+                self.inflight += 1
+                waiter.set_result(None)
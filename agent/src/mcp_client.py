@@ -1,22 +1,52 @@
+import asyncio
+import time
 import httpx
-from typing import Dict, Any, Optional
+from typing import Dict, Any, Optional, AsyncIterator, Iterable, List, Set, Tuple
+from concurrency import AdaptiveConcurrencyLimiter, LatencyTracker, RetryBudget
+
+# Cheap control-plane calls whose latency says nothing about server load
+UNTRACKED_METHODS = {"initialize", "ping", "tools/list", "prompts/list", "resources/list"}
 
 class MCPClient:
     """Client for communicating with MCP server using JSON-RPC 2.0 protocol."""
     
-    def __init__(self, server_url: str):
+    def __init__(self, server_url: str, hedge_percentile: Optional[float] = None,
+                 idempotent_tools: Optional[Iterable[str]] = None, max_retries: int = 0,
+                 limiter: Optional[AdaptiveConcurrencyLimiter] = None,
+                 retry_budget: Optional[RetryBudget] = None):
         self.server_url = server_url.rstrip('/')
         self.client = httpx.AsyncClient()
         self.initialized = False
         self.request_id = 1
+        # Hedging and retries only apply to idempotent tool calls and are opt-in
+        self.hedge_percentile = hedge_percentile
+        self.idempotent_tools: Set[str] = set(idempotent_tools or [])
+        self.max_retries = max_retries
+        self.limiter = limiter or AdaptiveConcurrencyLimiter()
+        self.retry_budget = retry_budget or RetryBudget()
+        # Latency windows per tool or method, feeding hedge delays
+        self.latency: Dict[str, LatencyTracker] = {}
+        self.stats = {
+            "requests": 0,
+            "errors": 0,
+            "retries": 0,
+            "hedges_sent": 0,
+            "hedges_won": 0,
+            "budget_exhausted": 0
+        }
     
     def _get_next_id(self) -> int:
         """Get next request ID."""
         self.request_id += 1
         return self.request_id
     
-    async def _send_jsonrpc_request(self, method: str, params: Optional[Dict[str, Any]] = None) -> Dict[str, Any]:
-        """Send JSON-RPC 2.0 request."""
+    async def _send_jsonrpc_request(self, method: str, params: Optional[Dict[str, Any]] = None,
+                                    idempotent: bool = False) -> Dict[str, Any]:
+        """Send JSON-RPC 2.0 request.
+        
+        Idempotent requests may be hedged and retried on connection errors,
+        both subject to the retry budget.
+        """
         request_data = {
             "jsonrpc": "2.0",
             "method": method,
@@ -26,6 +56,45 @@ class MCPClient:
         if params:
             request_data["params"] = params
         
+        self.stats["requests"] += 1
+        self.retry_budget.deposit()
+        if not idempotent:
+            return await self._post(request_data)
+        
+        attempt = 0
+        while True:
+            try:
+                return await self._send_hedged(request_data)
+            except ConnectionError:
+                if attempt >= self.max_retries or not self._spend_budget():
+                    raise
+                attempt += 1
+                self.stats["retries"] += 1
+                request_data = dict(request_data, id=self._get_next_id())
+    
+    @staticmethod
+    def _latency_key(request_data: Dict[str, Any]) -> Optional[str]:
+        """Name the kind of request for latency tracking, or None to skip it."""
+        method = request_data["method"]
+        if method in UNTRACKED_METHODS:
+            return None
+        if method == "tools/call":
+            return f"tools/call:{request_data.get('params', {}).get('name')}"
+        return method
+    
+    def _latency_tracker(self, key: str) -> LatencyTracker:
+        """Get the latency window for a request kind."""
+        tracker = self.latency.get(key)
+        if tracker is None:
+            tracker = self.latency[key] = LatencyTracker()
+        return tracker
+    
+    async def _post(self, request_data: Dict[str, Any], acquired: bool = False) -> Dict[str, Any]:
+        """POST a single JSON-RPC message within the concurrency limit."""
+        if not acquired:
+            await self.limiter.acquire()
+        
+        started = time.monotonic()
         try:
             response = await self.client.post(
                 self.server_url,
@@ -33,11 +102,133 @@ class MCPClient:
                 headers={"Content-Type": "application/json"}
             )
             response.raise_for_status()
-            return response.json()
+            result = response.json()
         except httpx.RequestError as e:
+            self._record_failure()
             raise ConnectionError(f"Failed to connect to MCP server: {e}")
         except httpx.HTTPStatusError as e:
+            self._record_failure()
             raise RuntimeError(f"HTTP error from MCP server: {e}")
+        except asyncio.CancelledError:
+            # Cancelled hedge losers carry no latency signal
+            self.limiter.release()
+            raise
+        except Exception:
+            self._record_failure()
+            raise
+        
+        latency = time.monotonic() - started
+        key = self._latency_key(request_data)
+        if key is not None:
+            self._latency_tracker(key).record(latency)
+        self.limiter.release(latency=latency, key=key)
+        return result
+    
+    def _record_failure(self) -> None:
+        self.stats["errors"] += 1
+        self.limiter.release(error=True)
+    
+    def _spend_budget(self) -> bool:
+        """Withdraw from the retry budget, counting refusals."""
+        if self.retry_budget.try_withdraw():
+            return True
+        self.stats["budget_exhausted"] += 1
+        return False
+    
+    async def _send_hedged(self, request_data: Dict[str, Any]) -> Dict[str, Any]:
+        """Send a request, racing a duplicate once it outlives the hedge threshold."""
+        delay = None
+        key = self._latency_key(request_data)
+        if self.hedge_percentile is not None and key in self.latency:
+            delay = self.latency[key].percentile(self.hedge_percentile)
+        
+        primary = asyncio.ensure_future(self._post(request_data))
+        if delay is None:
+            return await primary
+        
+        tasks = {primary}
+        try:
+            done, _ = await asyncio.wait(tasks, timeout=delay)
+            if done:
+                return primary.result()
+            
+            # Hedges never wait for a slot, so they cannot queue behind an overload
+            if not self.limiter.try_acquire():
+                return await primary
+            if not self._spend_budget():
+                self.limiter.release()
+                return await primary
+            
+            self.stats["hedges_sent"] += 1
+            hedge = asyncio.ensure_future(
+                self._post(dict(request_data, id=self._get_next_id()), acquired=True)
+            )
+            tasks.add(hedge)
+            
+            pending = set(tasks)
+            error = None
+            while pending:
+                done, pending = await asyncio.wait(pending, return_when=asyncio.FIRST_COMPLETED)
+                for task in done:
+                    if task.exception() is None:
+                        if task is hedge:
+                            self.stats["hedges_won"] += 1
+                        return task.result()
+                    error = error or task.exception()
+            raise error
+        finally:
+            for task in tasks:
+                if not task.done():
+                    task.cancel()
+    
+    def get_stats(self) -> Dict[str, Any]:
+        """Get request, hedging and concurrency limit statistics.
+        
+        `hedge_delays` maps each tracked tool or method to its current hedge
+        threshold in seconds (None until enough samples are collected).
+        """
+        return dict(
+            self.stats,
+            concurrency_limit=self.limiter.limit,
+            inflight=self.limiter.inflight,
+            retry_tokens=self.retry_budget.tokens,
+            hedge_delays={
+                key: tracker.percentile(self.hedge_percentile)
+                for key, tracker in self.latency.items()
+            } if self.hedge_percentile is not None else {}
+        )
+    
+    async def _post_notification(self, payload: Any) -> None:
+        """POST notifications; the server replies without a body, so none is parsed."""
+        try:
+            response = await self.client.post(
+                self.server_url,
+                json=payload,
+                headers={"Content-Type": "application/json"}
+            )
+            response.raise_for_status()
+        except httpx.RequestError as e:
+            raise ConnectionError(f"Failed to connect to MCP server: {e}")
+        except httpx.HTTPStatusError as e:
+            raise RuntimeError(f"HTTP error from MCP server: {e}")
+    
+    async def notify(self, method: str, params: Optional[Dict[str, Any]] = None) -> None:
+        """Send a JSON-RPC 2.0 notification, which has no id and gets no result."""
+        notification = {"jsonrpc": "2.0", "method": method}
+        if params:
+            notification["params"] = params
+        await self._post_notification(notification)
+    
+    async def notify_batch(self, notifications: List[Tuple[str, Optional[Dict[str, Any]]]]) -> None:
+        """Send several notifications in a single fire-and-forget batch."""
+        batch = []
+        for method, params in notifications:
+            notification = {"jsonrpc": "2.0", "method": method}
+            if params:
+                notification["params"] = params
+            batch.append(notification)
+        if batch:
+            await self._post_notification(batch)
     
     async def initialize(self) -> Dict[str, Any]:
         """Initialize connection with MCP server."""
@@ -57,6 +248,7 @@ class MCPClient:
         if "error" in response:
             raise RuntimeError(f"Initialize failed: {response['error']}")
         
+        await self.notify("notifications/initialized")
         self.initialized = True
         return response.get("result", {})
     
@@ -70,7 +262,11 @@ class MCPClient:
         if "error" in response:
             raise RuntimeError(f"Tools list failed: {response['error']}")
         
-        return response.get("result", {})
+        result = response.get("result", {})
+        for tool in result.get("tools", []):
+            if tool.get("annotations", {}).get("idempotentHint"):
+                self.idempotent_tools.add(tool["name"])
+        return result
     
     async def call_tool(self, tool_name: str, arguments: Optional[Dict[str, Any]] = None) -> Any:
         """Call a tool on the MCP server."""
@@ -83,13 +279,104 @@ class MCPClient:
         if arguments:
             params["arguments"] = arguments
         
-        response = await self._send_jsonrpc_request("tools/call", params)
+        response = await self._send_jsonrpc_request(
+            "tools/call", params, idempotent=tool_name in self.idempotent_tools
+        )
         
         if "error" in response:
             raise RuntimeError(f"Tool call failed: {response['error']}")
         
         return response.get("result", {})
     
+    async def list_prompts(self) -> Dict[str, Any]:
+        """List available prompts from MCP server."""
+        if not self.initialized:
+            await self.initialize()
+        
+        response = await self._send_jsonrpc_request("prompts/list")
+        
+        if "error" in response:
+            raise RuntimeError(f"Prompts list failed: {response['error']}")
+        
+        return response.get("result", {})
+    
+    async def get_prompt(self, prompt_name: str, arguments: Optional[Dict[str, str]] = None) -> Dict[str, Any]:
+        """Render a prompt on the MCP server."""
+        if not self.initialized:
+            await self.initialize()
+        
+        params = {
+            "name": prompt_name
+        }
+        if arguments:
+            params["arguments"] = arguments
+        
+        response = await self._send_jsonrpc_request("prompts/get", params)
+        
+        if "error" in response:
+            raise RuntimeError(f"Prompt get failed: {response['error']}")
+        
+        return response.get("result", {})
+    
+    async def list_resources(self) -> Dict[str, Any]:
+        """List available resources from MCP server."""
+        if not self.initialized:
+            await self.initialize()
+        
+        response = await self._send_jsonrpc_request("resources/list")
+        
+        if "error" in response:
+            raise RuntimeError(f"Resources list failed: {response['error']}")
+        
+        return response.get("result", {})
+    
+    async def read_resource(self, uri: str, offset: int = 0, length: Optional[int] = None) -> Dict[str, Any]:
+        """Read a byte range of a resource.
+        
+        The server caps the size of a single read; when more data remains in the
+        requested range the result carries a `nextOffset` to continue from.
+        """
+        if not self.initialized:
+            await self.initialize()
+        
+        params = {"uri": uri, "offset": offset}
+        if length is not None:
+            params["length"] = length
+        
+        response = await self._send_jsonrpc_request("resources/read", params)
+        
+        if "error" in response:
+            raise RuntimeError(f"Resource read failed: {response['error']}")
+        
+        return response.get("result", {})
+    
+    async def stream_resource(self, uri: str, offset: int = 0, length: Optional[int] = None) -> AsyncIterator[bytes]:
+        """Stream raw bytes of a resource range without buffering it in memory."""
+        if length == 0:
+            return
+        if not self.initialized:
+            await self.initialize()
+
+        headers = {}
+        if offset or length is not None:
+            end = "" if length is None else str(offset + length - 1)
+            headers["Range"] = f"bytes={offset}-{end}"
+        
+        try:
+            async with self.client.stream(
+                "GET",
+                f"{self.server_url}/resources/stream",
+                params={"uri": uri},
+                headers=headers
+            ) as response:
+                response.raise_for_status()
+                async for chunk in response.aiter_bytes():
+                    yield chunk
+        except httpx.RequestError as e:
+            raise ConnectionError(f"Failed to connect to MCP server: {e}")
+        except httpx.HTTPStatusError as e:
+            raise RuntimeError(f"HTTP error from MCP server: {e}")
+    
     async def close(self) -> None:
         """Close the HTTP client."""
         await self.client.aclose()
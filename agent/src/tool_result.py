@@ -0,0 +1,59 @@
+import base64
+from typing import Dict, Any, List, Optional
+
+class ToolResult:
+    """Tool call result that decodes content parts into native objects on first access."""
+
+    def __init__(self, raw: Dict[str, Any]):
+        self.raw = raw
+        self._parts: Optional[List[Any]] = None
+
+    @property
+    def is_error(self) -> bool:
+        """Whether the tool reported an error."""
+        return bool(self.raw.get("isError", False))
+
+    @property
+    def structured(self) -> Optional[Dict[str, Any]]:
+        """The structuredContent object, if the tool returned one."""
+        return self.raw.get("structuredContent")
+
+    @property
+    def parts(self) -> List[Any]:
+        """Decoded content parts: str for text, bytes for images and binary resources."""
+        if self._parts is None:
+            self._parts = [self._decode_part(part) for part in self.raw.get("content", [])]
+        return self._parts
+
+    @property
+    def value(self) -> Any:
+        """structuredContent if present, else the single decoded part or the list of parts."""
+        if self.structured is not None:
+            return self.structured
+        parts = self.parts
+        if len(parts) == 1:
+            return parts[0]
+        return parts
+
+    @property
+    def text(self) -> str:
+        """Concatenated text parts."""
+        return "".join(
+            part.get("text", "") for part in self.raw.get("content", [])
+            if part.get("type") == "text"
+        )
+
+    @staticmethod
+    def _decode_part(part: Dict[str, Any]) -> Any:
+        """Decode a single content part."""
+        part_type = part.get("type")
+        if part_type == "text":
+            return part.get("text", "")
+        if part_type in ("image", "audio"):
+            return base64.b64decode(part.get("data", ""))
+        if part_type == "resource":
+            resource = part.get("resource", {})
+            if "blob" in resource:
+                return base64.b64decode(resource["blob"])
+            return resource.get("text", "")
+        return part
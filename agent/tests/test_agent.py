@@ -46,4 +46,36 @@ async def test_execute_tool_not_registered(agent_with_mocks):
     agent_with_mocks.tool_registry.is_tool_registered.return_value = False
     
     with pytest.raises(ValueError, match="Tool 'unknown' is not registered"):
-        await agent_with_mocks.execute_tool("unknown", {})
\ No newline at end of file
+        await agent_with_mocks.execute_tool("unknown", {})
+
+@pytest.mark.asyncio
+async def test_execute_tool_decoded(agent_with_mocks):
+    """Test tool execution with lazy result decoding."""
+    agent_with_mocks.tool_registry.is_tool_registered.return_value = True
+    agent_with_mocks.mcp_client.call_tool.return_value = {
+        "content": [{"type": "text", "text": '{"items":[1,2]}'}],
+        "structuredContent": {"items": [1, 2]}
+    }
+    
+    result = await agent_with_mocks.execute_tool("test", {}, decode=True)
+    
+    assert result.value == {"items": [1, 2]}
+
+@pytest.mark.asyncio
+async def test_list_prompts(agent_with_mocks):
+    """Test listing prompts."""
+    agent_with_mocks.mcp_client.list_prompts.return_value = {"prompts": [{"name": "greeting"}]}
+    
+    prompts = await agent_with_mocks.list_prompts()
+    
+    assert prompts == [{"name": "greeting"}]
+
+@pytest.mark.asyncio
+async def test_get_prompt(agent_with_mocks):
+    """Test rendering a prompt."""
+    agent_with_mocks.mcp_client.get_prompt.return_value = {"messages": []}
+    
+    result = await agent_with_mocks.get_prompt("greeting", {"name": "Ada"})
+    
+    assert result == {"messages": []}
+    agent_with_mocks.mcp_client.get_prompt.assert_called_once_with("greeting", {"name": "Ada"})
@@ -0,0 +1,139 @@
+import asyncio
+import math
+import random
+import pytest
+from src.concurrency import AdaptiveConcurrencyLimiter, LatencyTracker, RetryBudget
+
+def test_latency_percentile_requires_samples():
+    """Test percentiles are withheld until enough samples exist."""
+    tracker = LatencyTracker(min_samples=5)
+    for latency in [0.1, 0.2, 0.3, 0.4]:
+        tracker.record(latency)
+    assert tracker.percentile(50) is None
+    
+    tracker.record(0.5)
+    assert tracker.percentile(50) == 0.3
+    assert tracker.percentile(100) == 0.5
+
+def test_retry_budget_limits_extra_attempts():
+    """Test the budget only refills by a fraction per request."""
+    budget = RetryBudget(ratio=0.5, max_tokens=1)
+    assert budget.try_withdraw()
+    assert not budget.try_withdraw()
+    
+    budget.deposit()
+    assert not budget.try_withdraw()
+    budget.deposit()
+    assert budget.try_withdraw()
+
+def test_limiter_additive_increase_multiplicative_decrease():
+    """Test AIMD adjustments of the concurrency limit."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=10, backoff_ratio=0.5)
+    
+    assert limiter.try_acquire()
+    limiter.release(latency=0.01, key="tools/call:a")
+    assert limiter.limit == pytest.approx(10.1)
+    
+    assert limiter.try_acquire()
+    limiter.release(error=True)
+    assert limiter.limit == pytest.approx(5.05)
+    
+    # Decreases are spaced at least one window apart
+    assert limiter.try_acquire()
+    limiter.release(error=True)
+    assert limiter.limit == pytest.approx(5.05)
+
+def _simulate(limiter, samples):
+    for key, latency in samples:
+        assert limiter.try_acquire()
+        limiter.release(latency=latency, key=key)
+
+def test_limiter_steady_under_jitter():
+    """Test ordinary lognormal jitter does not shrink the limit."""
+    rng = random.Random(42)
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=20)
+    
+    _simulate(limiter, [("tools/call:a", rng.lognormvariate(math.log(0.02), 0.5)) for _ in range(2000)])
+    
+    assert limiter.limit >= 20
+
+def test_limiter_steady_under_mixed_methods():
+    """Test fast and slow request kinds are not compared with each other."""
+    rng = random.Random(7)
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=20)
+    samples = []
+    for _ in range(2000):
+        if rng.random() < 0.5:
+            samples.append(("resources/read", 0.005 * rng.uniform(0.8, 1.2)))
+        else:
+            samples.append(("tools/call:a", rng.uniform(0.015, 0.025)))
+    
+    _simulate(limiter, samples)
+    
+    assert limiter.limit >= 20
+
+def test_limiter_backs_off_when_latency_rises():
+    """Test a sustained latency increase shrinks the limit."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=20)
+    _simulate(limiter, [("tools/call:a", 0.02)] * 200)
+    steady = limiter.limit
+    
+    _simulate(limiter, [("tools/call:a", 0.2)] * 100)
+    
+    assert limiter.limit < steady
+
+def test_limiter_ignores_untracked_latency():
+    """Test releases without a key leave the limit unchanged."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=20)
+    _simulate(limiter, [(None, 5.0)] * 50)
+    
+    assert limiter.limit == 20
+
+@pytest.mark.asyncio
+async def test_limiter_blocks_at_limit():
+    """Test that acquire waits for a free slot."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    await limiter.acquire()
+    assert not limiter.try_acquire()
+    
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    assert not waiter.done()
+    
+    limiter.release()
+    await asyncio.wait_for(waiter, 1)
+    assert limiter.inflight == 1
+
+@pytest.mark.asyncio
+async def test_limiter_cancelled_waiter_frees_queue():
+    """Test cancelled waiters do not hold slots."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    await limiter.acquire()
+    
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    
+    limiter.release()
+    assert limiter.inflight == 0
+    assert limiter.try_acquire()
+
+@pytest.mark.asyncio
+async def test_limiter_waiter_cancelled_before_release():
+    """Test a waiter cancelled and then popped by release still raises CancelledError."""
+    limiter = AdaptiveConcurrencyLimiter(initial_limit=1)
+    await limiter.acquire()
+    
+    waiter = asyncio.ensure_future(limiter.acquire())
+    await asyncio.sleep(0)
+    waiter.cancel()
+    # Runs before the cancelled task gets to clean up its queue entry
+    limiter.release()
+    with pytest.raises(asyncio.CancelledError):
+        await waiter
+    
+    assert limiter.inflight == 0
+    assert not limiter._waiters
+    assert limiter.try_acquire()
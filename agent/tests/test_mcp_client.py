@@ -1,3 +1,4 @@
+import asyncio
 import pytest
 from unittest.mock import AsyncMock, Mock
 import httpx
@@ -65,3 +66,159 @@ async def test_connection_error(mcp_client_with_mock):
     
     with pytest.raises(ConnectionError, match="Failed to connect to MCP server"):
         await mcp_client_with_mock.initialize()
+
+@pytest.mark.asyncio
+async def test_read_resource_range(mcp_client_with_mock):
+    """Test ranged resource read."""
+    expected_response = {"jsonrpc": "2.0", "result": {"contents": [{"uri": "file:///a.txt", "text": "llo"}]}, "id": 5}
+    mock_response = Mock()
+    mock_response.json.return_value = expected_response
+    mock_response.raise_for_status.return_value = None
+    
+    mcp_client_with_mock.client.post.return_value = mock_response
+    mcp_client_with_mock.initialized = True
+    
+    result = await mcp_client_with_mock.read_resource("file:///a.txt", offset=2, length=3)
+    
+    assert result == {"contents": [{"uri": "file:///a.txt", "text": "llo"}]}
+    sent = mcp_client_with_mock.client.post.call_args.kwargs["json"]
+    assert sent["method"] == "resources/read"
+    assert sent["params"] == {"uri": "file:///a.txt", "offset": 2, "length": 3}
+
+@pytest.mark.asyncio
+async def test_list_tools_marks_idempotent_tools(mcp_client_with_mock):
+    """Test idempotent tools are picked up from tool annotations."""
+    tools = [
+        {"name": "helloworld", "annotations": {"idempotentHint": True}},
+        {"name": "writer", "annotations": {}}
+    ]
+    mock_response = Mock()
+    mock_response.json.return_value = {"jsonrpc": "2.0", "result": {"tools": tools}, "id": 6}
+    mock_response.raise_for_status.return_value = None
+    
+    mcp_client_with_mock.client.post.return_value = mock_response
+    mcp_client_with_mock.initialized = True
+    
+    await mcp_client_with_mock.list_tools()
+    
+    assert mcp_client_with_mock.idempotent_tools == {"helloworld"}
+
+@pytest.mark.asyncio
+async def test_call_tool_hedges_slow_request(mcp_client_with_mock):
+    """Test a slow idempotent call is hedged and the first response wins."""
+    fast_response = Mock()
+    fast_response.json.return_value = {"jsonrpc": "2.0", "result": {"content": []}, "id": 8}
+    fast_response.raise_for_status.return_value = None
+    calls = []
+    
+    async def post(url, json, headers):
+        calls.append(json["id"])
+        if len(calls) == 1:
+            await asyncio.sleep(10)
+        return fast_response
+    
+    mcp_client_with_mock.client.post.side_effect = post
+    mcp_client_with_mock.initialized = True
+    mcp_client_with_mock.hedge_percentile = 95
+    mcp_client_with_mock.idempotent_tools.add("helloworld")
+    tracker = mcp_client_with_mock._latency_tracker("tools/call:helloworld")
+    for _ in range(20):
+        tracker.record(0.01)
+    
+    result = await asyncio.wait_for(mcp_client_with_mock.call_tool("helloworld"), 1)
+    
+    assert result == {"content": []}
+    assert len(set(calls)) == 2
+    stats = mcp_client_with_mock.get_stats()
+    assert stats["hedges_sent"] == 1
+    assert stats["hedges_won"] == 1
+    assert stats["inflight"] == 0
+    assert stats["hedge_delays"] == {"tools/call:helloworld": 0.01}
+
+@pytest.mark.asyncio
+async def test_latency_tracked_per_tool(mcp_client_with_mock):
+    """Test hedge latency windows are kept per tool and skip control-plane calls."""
+    mock_response = Mock()
+    mock_response.json.return_value = {"jsonrpc": "2.0", "result": {}, "id": 10}
+    mock_response.raise_for_status.return_value = None
+    mcp_client_with_mock.client.post.return_value = mock_response
+    
+    await mcp_client_with_mock.initialize()
+    await mcp_client_with_mock.list_tools()
+    await mcp_client_with_mock.call_tool("helloworld")
+    await mcp_client_with_mock.call_tool("other")
+    
+    assert set(mcp_client_with_mock.latency) == {"tools/call:helloworld", "tools/call:other"}
+
+@pytest.mark.asyncio
+async def test_non_idempotent_call_is_not_retried(mcp_client_with_mock):
+    """Test retries only apply to idempotent tools."""
+    mcp_client_with_mock.client.post.side_effect = httpx.RequestError("Connection failed")
+    mcp_client_with_mock.initialized = True
+    mcp_client_with_mock.max_retries = 3
+    
+    with pytest.raises(ConnectionError):
+        await mcp_client_with_mock.call_tool("writer")
+    
+    assert mcp_client_with_mock.client.post.call_count == 1
+    assert mcp_client_with_mock.get_stats()["retries"] == 0
+
+@pytest.mark.asyncio
+async def test_retries_are_capped_by_budget(mcp_client_with_mock):
+    """Test idempotent retries stop when the retry budget is spent."""
+    mcp_client_with_mock.client.post.side_effect = httpx.RequestError("Connection failed")
+    mcp_client_with_mock.initialized = True
+    mcp_client_with_mock.max_retries = 5
+    mcp_client_with_mock.idempotent_tools.add("helloworld")
+    mcp_client_with_mock.retry_budget.tokens = 2
+    
+    with pytest.raises(ConnectionError):
+        await mcp_client_with_mock.call_tool("helloworld")
+    
+    stats = mcp_client_with_mock.get_stats()
+    assert stats["retries"] == 2
+    assert stats["budget_exhausted"] == 1
+
+@pytest.mark.asyncio
+async def test_notify_sends_no_id(mcp_client_with_mock):
+    """Test notifications are sent without an id and the body is not parsed."""
+    mock_response = Mock()
+    mock_response.raise_for_status.return_value = None
+    mcp_client_with_mock.client.post.return_value = mock_response
+    
+    result = await mcp_client_with_mock.notify("notifications/message", {"level": "info"})
+    
+    assert result is None
+    sent = mcp_client_with_mock.client.post.call_args.kwargs["json"]
+    assert sent == {"jsonrpc": "2.0", "method": "notifications/message", "params": {"level": "info"}}
+    mock_response.json.assert_not_called()
+
+@pytest.mark.asyncio
+async def test_notify_batch(mcp_client_with_mock):
+    """Test several notifications are sent as one batch."""
+    mock_response = Mock()
+    mock_response.raise_for_status.return_value = None
+    mcp_client_with_mock.client.post.return_value = mock_response
+    
+    await mcp_client_with_mock.notify_batch([("notifications/a", None), ("notifications/b", {"x": 1})])
+    
+    sent = mcp_client_with_mock.client.post.call_args.kwargs["json"]
+    assert [item["method"] for item in sent] == ["notifications/a", "notifications/b"]
+    assert all("id" not in item for item in sent)
+
+@pytest.mark.asyncio
+async def test_get_prompt_success(mcp_client_with_mock):
+    """Test successful prompt rendering."""
+    messages = [{"role": "user", "content": {"type": "text", "text": "Hi"}}]
+    mock_response = Mock()
+    mock_response.json.return_value = {"jsonrpc": "2.0", "result": {"messages": messages}, "id": 9}
+    mock_response.raise_for_status.return_value = None
+    
+    mcp_client_with_mock.client.post.return_value = mock_response
+    mcp_client_with_mock.initialized = True
+    
+    result = await mcp_client_with_mock.get_prompt("greeting", {"name": "Ada"})
+    
+    assert result == {"messages": messages}
+    sent = mcp_client_with_mock.client.post.call_args.kwargs["json"]
+    assert sent["params"] == {"name": "greeting", "arguments": {"name": "Ada"}}
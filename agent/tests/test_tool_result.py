@@ -0,0 +1,40 @@
+import base64
+import pytest
+from src.tool_result import ToolResult
+
+def test_text_result():
+    """Test decoding a single text part."""
+    result = ToolResult({"content": [{"type": "text", "text": "Hello, World!"}], "isError": False})
+    assert result.value == "Hello, World!"
+    assert result.text == "Hello, World!"
+    assert not result.is_error
+
+def test_structured_result():
+    """Test structuredContent is preferred over the text fallback."""
+    result = ToolResult({
+        "content": [{"type": "text", "text": '{"count":2}'}],
+        "structuredContent": {"count": 2}
+    })
+    assert result.value == {"count": 2}
+    assert result.text == '{"count":2}'
+
+def test_image_and_resource_parts():
+    """Test decoding image and embedded resource parts into bytes."""
+    encoded = base64.b64encode(b"\x00\xff").decode("ascii")
+    result = ToolResult({
+        "content": [
+            {"type": "image", "data": encoded, "mimeType": "image/png"},
+            {"type": "resource", "resource": {"uri": "blob:x", "blob": encoded}},
+            {"type": "resource", "resource": {"uri": "file:///a.txt", "text": "abc"}}
+        ]
+    })
+    assert result.value == [b"\x00\xff", b"\x00\xff", "abc"]
+
+def test_parts_are_decoded_lazily():
+    """Test that decoding happens on first access only."""
+    raw = {"content": [{"type": "image", "data": "not base64!"}]}
+    result = ToolResult(raw)
+    assert result.raw is raw
+
+    with pytest.raises(ValueError):
+        result.parts
@@ -0,0 +1,93 @@
+import json
+import queue
+import threading
+from typing import Dict, Any, List, Optional
+
+_STOP = object()
+
+class TrafficRecorder:
+    """Appends incoming JSON-RPC traffic to a JSONL capture file.
+
+    Recording only enqueues the raw request body and timings; parsing and
+    writing happen on a background thread. When the queue is full, records are
+    dropped and counted rather than slowing down request handling.
+    """
+
+    def __init__(self, path: str, max_queue: int = 10000):
+        self.path = path
+        self.dropped = 0
+        self._queue: "queue.Queue[Any]" = queue.Queue(maxsize=max_queue)
+        self._thread = threading.Thread(target=self._run, name="traffic-recorder", daemon=True)
+        self._thread.start()
+
+    def record(self, body: bytes, timestamp: float, duration: float,
+               response_bytes: int, status_code: int) -> None:
+        """Queue one request for capture."""
+        try:
+            self._queue.put_nowait((body, timestamp, duration, response_bytes, status_code))
+        except queue.Full:
+            self.dropped += 1
+
+    def close(self) -> None:
+        """Flush pending records and stop the writer thread."""
+        if self._thread.is_alive():
+            self._queue.put(_STOP)
+            self._thread.join()
+
+    @staticmethod
+    def _format(item: tuple) -> str:
+        body, timestamp, duration, response_bytes, status_code = item
+        try:
+            message = json.loads(body)
+        except ValueError:
+            message = body.decode("utf-8", errors="replace")
+        record = {
+            "timestamp": timestamp,
+            "durationMs": round(duration * 1000, 3),
+            "requestBytes": len(body),
+            "responseBytes": response_bytes,
+            "status": status_code,
+            "message": message
+        }
+        return json.dumps(record, separators=(",", ":")) + "\n"
+
+    def _run(self) -> None:
+        with open(self.path, "a", encoding="utf-8") as capture_file:
+            while True:
+                item = self._queue.get()
+
+                # Drain whatever else is queued and write it in one go
+                batch: List[str] = []
+                stop = False
+                while True:
+                    if item is _STOP:
+                        stop = True
+                    else:
+                        batch.append(self._format(item))
+                    try:
+                        item = self._queue.get_nowait()
+                    except queue.Empty:
+                        break
+
+                capture_file.write("".join(batch))
+                capture_file.flush()
+                if stop:
+                    return
+
+def load_capture(path: str) -> List[Dict[str, Any]]:
+    """Load capture records from a JSONL file, skipping blank lines."""
+    records = []
+    with open(path, encoding="utf-8") as capture_file:
+        for line in capture_file:
+            line = line.strip()
+            if line:
+                records.append(json.loads(line))
+    return records
+
+def message_method(message: Any) -> Optional[str]:
+    """Get the method name of a captured message, or "batch" for batches."""
+    if isinstance(message, list):
+        return "batch"
+    if isinstance(message, dict):
+        return message.get("method")
+    return None
@@ -1,6 +1,11 @@
+import os
 import uvicorn
 from server import MCPServer
 
 if __name__ == "__main__":
-    app = MCPServer().create_app()
+    app = MCPServer(
+        resource_dir=os.getenv("MCP_RESOURCE_DIR"),
+        capture_path=os.getenv("MCP_CAPTURE_PATH"),
+        text_fallback=os.getenv("MCP_TEXT_FALLBACK", "").lower() in ("1", "true", "yes")
+    ).create_app()
     uvicorn.run(app, host="0.0.0.0", port=8080)
\ No newline at end of file
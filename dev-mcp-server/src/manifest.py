@@ -6,6 +6,19 @@ class ToolSchema(BaseModel):
     name: str
     description: str
     parameters: Dict[str, Any]
+    annotations: Dict[str, Any] = {}
+
+class PromptArgumentSchema(BaseModel):
+    """Schema for prompt argument definition."""
+    name: str
+    description: str = ""
+    required: bool = False
+
+class PromptSchema(BaseModel):
+    """Schema for prompt definition."""
+    name: str
+    description: str
+    arguments: List[PromptArgumentSchema]
 
 class MCPManifest(BaseModel):
     """MCP Manifest model."""
@@ -25,9 +38,23 @@ class ManifestManager:
             schema = ToolSchema(
                 name=tool.name,
                 description=tool.description,
-                parameters=tool.get_parameters_schema()
+                parameters=tool.get_parameters_schema(),
+                annotations=tool.annotations
             )
             tool_schemas.append(schema)
         
         manifest = MCPManifest(version=self.version, tools=tool_schemas)
-        return manifest.model_dump()
\ No newline at end of file
+        return manifest.model_dump()
+    
+    def get_prompts(self, prompts: List[Any]) -> List[Dict[str, Any]]:
+        """Generate prompt metadata from available prompts."""
+        prompt_schemas = []
+        for prompt in prompts:
+            schema = PromptSchema(
+                name=prompt.name,
+                description=prompt.description,
+                arguments=[PromptArgumentSchema(**argument) for argument in prompt.get_arguments()]
+            )
+            prompt_schemas.append(schema.model_dump())
+        
+        return prompt_schemas
\ No newline at end of file
@@ -0,0 +1,33 @@
+from typing import Dict, Any, List
+from prompts.template import BasePrompt
+
+class GreetingPrompt(BasePrompt):
+    """Greeting prompt implementation."""
+
+    @property
+    def name(self) -> str:
+        return "greeting"
+
+    @property
+    def description(self) -> str:
+        return "Ask the model to write a short greeting for someone"
+
+    @property
+    def template(self) -> str:
+        return "Write a short, {tone} greeting for {name}."
+
+    def get_arguments(self) -> List[Dict[str, Any]]:
+        """Get argument definitions."""
+        return [
+            {
+                "name": "name",
+                "description": "Name of the person to greet",
+                "required": True
+            },
+            {
+                "name": "tone",
+                "description": "Tone of the greeting",
+                "required": False,
+                "default": "friendly"
+            }
+        ]
@@ -0,0 +1,127 @@
+import string
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from typing import Dict, Any, List, Optional, Tuple
+
+class CompiledTemplate:
+    """Prompt template parsed once into literal and placeholder segments.
+
+    Templates use `{name}` placeholders; `{{` and `}}` produce literal braces.
+    """
+
+    def __init__(self, template: str):
+        self.segments: List[Tuple[str, Optional[str]]] = []
+        for literal, field, format_spec, conversion in string.Formatter().parse(template):
+            if field is not None and (format_spec or conversion or not field.isidentifier()):
+                raise ValueError(f"Unsupported placeholder in template: {{{field}}}")
+            self.segments.append((literal, field))
+        self.fields = {field for _, field in self.segments if field is not None}
+
+    def render(self, arguments: Dict[str, str]) -> str:
+        """Render the template with the given argument values."""
+        parts = []
+        for literal, field in self.segments:
+            parts.append(literal)
+            if field is not None:
+                parts.append(arguments[field])
+        return "".join(parts)
+
+class BasePrompt(ABC):
+    """Abstract base class for all prompts."""
+
+    _compiled: Optional[CompiledTemplate] = None
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Prompt name."""
+        pass
+
+    @property
+    @abstractmethod
+    def description(self) -> str:
+        """Prompt description."""
+        pass
+
+    @property
+    @abstractmethod
+    def template(self) -> str:
+        """Prompt template text with `{argument}` placeholders."""
+        pass
+
+    @abstractmethod
+    def get_arguments(self) -> List[Dict[str, Any]]:
+        """Get argument definitions: name, description, required and optional default."""
+        pass
+
+    def compile(self) -> None:
+        """Compile the template and check it only uses declared arguments."""
+        compiled = CompiledTemplate(self.template)
+        declared = {argument["name"] for argument in self.get_arguments()}
+        undeclared = compiled.fields - declared
+        if undeclared:
+            raise ValueError(f"Prompt '{self.name}' uses undeclared arguments: {sorted(undeclared)}")
+        self._compiled = compiled
+
+    def validate_arguments(self, arguments: Dict[str, Any]) -> Dict[str, str]:
+        """Validate arguments and fill in defaults for optional ones."""
+        definitions = {argument["name"]: argument for argument in self.get_arguments()}
+
+        unknown = set(arguments) - set(definitions)
+        if unknown:
+            raise ValueError(f"Unknown arguments: {sorted(unknown)}")
+
+        values = {}
+        for name, definition in definitions.items():
+            if name in arguments:
+                if not isinstance(arguments[name], str):
+                    raise ValueError(f"Argument '{name}' must be a string")
+                values[name] = arguments[name]
+            elif definition.get("required", False):
+                raise ValueError(f"Missing required argument: {name}")
+            else:
+                values[name] = definition.get("default", "")
+        return values
+
+    def render(self, arguments: Dict[str, Any]) -> str:
+        """Validate arguments and render the compiled template."""
+        return self.render_validated(self.validate_arguments(arguments))
+
+    def render_validated(self, values: Dict[str, str]) -> str:
+        """Render the compiled template with arguments from `validate_arguments`."""
+        if self._compiled is None:
+            self.compile()
+        return self._compiled.render(values)
+
+class PromptCache:
+    """Bounded LRU cache of rendered prompts keyed by name and arguments."""
+
+    def __init__(self, max_entries: int = 1024):
+        self.max_entries = max_entries
+        self._entries: "OrderedDict[Tuple, Dict[str, Any]]" = OrderedDict()
+
+    @staticmethod
+    def make_key(name: str, values: Dict[str, str]) -> Tuple:
+        """Build a cache key from validated argument values."""
+        return (name, tuple(sorted(values.items())))
+
+    def get(self, key: Tuple) -> Optional[Dict[str, Any]]:
+        """Get a cached result, marking the entry as recently used."""
+        result = self._entries.get(key)
+        if result is not None:
+            self._entries.move_to_end(key)
+        return result
+
+    def put(self, key: Tuple, result: Dict[str, Any]) -> None:
+        """Cache a result, evicting the least recently used entry if full."""
+        self._entries[key] = result
+        self._entries.move_to_end(key)
+        if len(self._entries) > self.max_entries:
+            self._entries.popitem(last=False)
+
+    def clear(self) -> None:
+        """Drop all cached results."""
+        self._entries.clear()
+
+    def __len__(self) -> int:
+        return len(self._entries)
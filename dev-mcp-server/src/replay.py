@@ -0,0 +1,180 @@
+"""Replay captured JSON-RPC traffic against an MCP server and report latencies.
+
+Usage:
+    python src/replay.py capture.jsonl [--target URL] [--speedup N]
+                         [--baseline FILE] [--save-baseline FILE]
+                         [--max-regression RATIO]
+
+Without --target the capture is replayed against an in-process MCPServer.
+"""
+import argparse
+import asyncio
+import json
+import math
+import sys
+import time
+from typing import Dict, Any, List, Optional
+
+import httpx
+
+from capture import load_capture, message_method
+from server import MCPServer
+
+def percentile(values: List[float], pct: float) -> float:
+    """Nearest-rank percentile of a non-empty list."""
+    ordered = sorted(values)
+    index = max(0, math.ceil(pct / 100 * len(ordered)) - 1)
+    return ordered[index]
+
+def _has_rpc_error(response: httpx.Response) -> bool:
+    """Check whether a JSON-RPC response (or any batch entry) carries an error."""
+    if not response.content:
+        return False
+    try:
+        payload = response.json()
+    except ValueError:
+        return False
+    entries = payload if isinstance(payload, list) else [payload]
+    return any(isinstance(entry, dict) and "error" in entry for entry in entries)
+
+async def replay(records: List[Dict[str, Any]], client: httpx.AsyncClient,
+                 speedup: float = 1.0) -> List[Dict[str, Any]]:
+    """Send captured messages, preserving their relative arrival times.
+
+    Results are returned in arrival order.
+
+    Requests are sent open-loop: each one starts at its scheduled offset
+    (divided by `speedup`) whether or not earlier ones have finished. A speedup
+    of 0 sends everything as fast as possible.
+    """
+    if not records:
+        return []
+
+    # Records are written as requests complete, so concurrent ones can be out of order
+    records = sorted(records, key=lambda record: record["timestamp"])
+    first_timestamp = records[0]["timestamp"]
+    started = time.perf_counter()
+
+    async def send(record: Dict[str, Any]) -> Dict[str, Any]:
+        if speedup > 0:
+            delay = (record["timestamp"] - first_timestamp) / speedup - (time.perf_counter() - started)
+            if delay > 0:
+                await asyncio.sleep(delay)
+
+        body = json.dumps(record["message"]).encode("utf-8")
+        request_started = time.perf_counter()
+        try:
+            response = await client.post("/", content=body, headers={"Content-Type": "application/json"})
+            latency = time.perf_counter() - request_started
+            status, response_bytes = response.status_code, len(response.content)
+            rpc_error = _has_rpc_error(response)
+        except httpx.RequestError:
+            latency = time.perf_counter() - request_started
+            status, response_bytes, rpc_error = 0, 0, False
+        return {
+            "method": message_method(record["message"]),
+            "latencyMs": latency * 1000,
+            "status": status,
+            "rpcError": rpc_error,
+            "responseBytes": response_bytes
+        }
+
+    return await asyncio.gather(*(send(record) for record in records))
+
+def summarize(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, Any]]:
+    """Latency distribution per method, plus an "all" entry."""
+    groups: Dict[str, List[Dict[str, Any]]] = {"all": list(results)}
+    for result in results:
+        groups.setdefault(str(result["method"]), []).append(result)
+
+    summary = {}
+    for method, group in groups.items():
+        if not group:
+            continue
+        latencies = [result["latencyMs"] for result in group]
+        summary[method] = {
+            "count": len(group),
+            "errors": sum(
+                1 for result in group
+                if result["rpcError"] or not 200 <= result["status"] < 300
+            ),
+            "meanMs": sum(latencies) / len(latencies),
+            "p50Ms": percentile(latencies, 50),
+            "p90Ms": percentile(latencies, 90),
+            "p99Ms": percentile(latencies, 99),
+            "maxMs": max(latencies),
+            "responseBytes": sum(result["responseBytes"] for result in group)
+        }
+    return summary
+
+def compare(summary: Dict[str, Dict[str, Any]], baseline: Dict[str, Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Relative change of p50 and p99 latency versus a baseline, per method."""
+    diff = {}
+    for method, stats in summary.items():
+        base = baseline.get(method)
+        if not base:
+            continue
+        diff[method] = {
+            key: (stats[key] - base[key]) / base[key] if base[key] else 0.0
+            for key in ("p50Ms", "p99Ms")
+        }
+    return diff
+
+def format_report(summary: Dict[str, Dict[str, Any]], diff: Optional[Dict[str, Dict[str, float]]] = None) -> str:
+    """Render a summary (and optional baseline diff) as a text table."""
+    lines = [f"{'method':<20} {'count':>7} {'errors':>6} {'p50ms':>9} {'p90ms':>9} {'p99ms':>9} {'maxms':>9}"]
+    for method, stats in sorted(summary.items()):
+        line = (
+            f"{method:<20} {stats['count']:>7} {stats['errors']:>6} {stats['p50Ms']:>9.2f} "
+            f"{stats['p90Ms']:>9.2f} {stats['p99Ms']:>9.2f} {stats['maxMs']:>9.2f}"
+        )
+        if diff and method in diff:
+            line += f"  p50 {diff[method]['p50Ms']:+.1%}  p99 {diff[method]['p99Ms']:+.1%}"
+        lines.append(line)
+    return "\n".join(lines)
+
+async def run(args: argparse.Namespace) -> int:
+    records = load_capture(args.capture)
+
+    if args.target:
+        client = httpx.AsyncClient(base_url=args.target)
+    else:
+        transport = httpx.ASGITransport(app=MCPServer(resource_dir=args.resource_dir).create_app())
+        client = httpx.AsyncClient(transport=transport, base_url="http://replay")
+
+    async with client:
+        results = await replay(records, client, speedup=args.speedup)
+
+    summary = summarize(results)
+    diff = None
+    if args.baseline:
+        with open(args.baseline, encoding="utf-8") as baseline_file:
+            diff = compare(summary, json.load(baseline_file))
+
+    print(format_report(summary, diff))
+
+    if args.save_baseline:
+        with open(args.save_baseline, "w", encoding="utf-8") as baseline_file:
+            json.dump(summary, baseline_file, indent=2)
+
+    if diff and args.max_regression is not None:
+        worst = max((change["p99Ms"] for change in diff.values()), default=0.0)
+        if worst > args.max_regression:
+            print(f"p99 regression {worst:.1%} exceeds {args.max_regression:.1%}", file=sys.stderr)
+            return 1
+    return 0
+
+def main() -> int:
+    parser = argparse.ArgumentParser(description="Replay captured MCP traffic and report latencies.")
+    parser.add_argument("capture", help="JSONL capture written with MCP_CAPTURE_PATH")
+    parser.add_argument("--target", help="Server URL; defaults to an in-process MCPServer")
+    parser.add_argument("--resource-dir", help="Resource directory for the in-process server")
+    parser.add_argument("--speedup", type=float, default=1.0, help="Time compression factor; 0 disables pacing")
+    parser.add_argument("--baseline", help="Summary JSON to compare against")
+    parser.add_argument("--save-baseline", help="Write this run's summary JSON here")
+    parser.add_argument("--max-regression", type=float,
+                        help="Fail if any method's p99 grows by more than this ratio over the baseline")
+    return asyncio.run(run(parser.parse_args()))
+
+if __name__ == "__main__":
+    sys.exit(main())
@@ -0,0 +1,228 @@
+import mimetypes
+import mmap
+import os
+import threading
+from abc import ABC, abstractmethod
+from collections import OrderedDict
+from pathlib import Path
+from typing import Dict, Any, Iterator, Optional
+
+DEFAULT_CHUNK_SIZE = 64 * 1024
+
+class BaseResource(ABC):
+    """Abstract base class for all resources."""
+
+    @property
+    @abstractmethod
+    def uri(self) -> str:
+        """Resource URI."""
+        pass
+
+    @property
+    @abstractmethod
+    def name(self) -> str:
+        """Resource name."""
+        pass
+
+    @property
+    def description(self) -> str:
+        """Resource description."""
+        return ""
+
+    @property
+    def mime_type(self) -> str:
+        """Resource MIME type."""
+        return "application/octet-stream"
+
+    @abstractmethod
+    def size(self) -> int:
+        """Total size of the resource in bytes."""
+        pass
+
+    @abstractmethod
+    def read_range(self, offset: int, length: Optional[int] = None) -> bytes:
+        """Read up to `length` bytes starting at `offset`."""
+        pass
+
+    def iter_chunks(self, offset: int = 0, length: Optional[int] = None,
+                    chunk_size: int = DEFAULT_CHUNK_SIZE) -> Iterator[bytes]:
+        """Yield the requested byte range in chunks of at most `chunk_size` bytes."""
+        end = self.size() if length is None else min(self.size(), offset + length)
+        while offset < end:
+            chunk = self.read_range(offset, min(chunk_size, end - offset))
+            if not chunk:
+                break
+            yield chunk
+            offset += len(chunk)
+
+    def close(self) -> None:
+        """Release any handles held by the resource."""
+        pass
+
+    def get_metadata(self) -> Dict[str, Any]:
+        """Get resource metadata as served by resources/list."""
+        return {
+            "uri": self.uri,
+            "name": self.name,
+            "description": self.description,
+            "mimeType": self.mime_type,
+            "size": self.size()
+        }
+
+class MappingPool:
+    """Bounds the number of memory-mapped files open at once.
+
+    Each mapping holds a file descriptor, so resources report their reads here
+    and the least recently used ones are closed once `max_mappings` is
+    exceeded. Closed resources reopen transparently on their next read.
+    """
+
+    def __init__(self, max_mappings: int = 128):
+        self.max_mappings = max_mappings
+        self._resources: "OrderedDict[int, BaseResource]" = OrderedDict()
+        self._lock = threading.Lock()
+
+    def touch(self, resource: BaseResource) -> None:
+        """Mark a resource as recently read, closing the oldest ones if over the limit."""
+        evicted = []
+        with self._lock:
+            self._resources[id(resource)] = resource
+            self._resources.move_to_end(id(resource))
+            while len(self._resources) > self.max_mappings:
+                evicted.append(self._resources.popitem(last=False)[1])
+        # Closed outside the lock because close() calls back into discard()
+        for old in evicted:
+            old.close()
+
+    def discard(self, resource: BaseResource) -> None:
+        """Forget a resource that has been closed."""
+        with self._lock:
+            self._resources.pop(id(resource), None)
+
+    def __len__(self) -> int:
+        return len(self._resources)
+
+class FileResource(BaseResource):
+    """Resource backed by a memory-mapped file on disk.
+
+    The mapping is created on first read and only the requested byte ranges are
+    copied out of it, so large files are never loaded into memory as a whole.
+    Opening, reading and closing share a lock because streamed reads run in a
+    threadpool. The file itself is closed once mapped, and a shared
+    `MappingPool` can bound how many mappings stay open.
+    """
+
+    def __init__(self, path: str, uri: Optional[str] = None, description: str = "",
+                 mime_type: Optional[str] = None, pool: Optional[MappingPool] = None):
+        self.path = Path(path).resolve()
+        self._uri = uri or self.path.as_uri()
+        self._description = description
+        self._mime_type = mime_type or mimetypes.guess_type(self.path.name)[0] or "application/octet-stream"
+        self._pool = pool
+        self._map: Optional[mmap.mmap] = None
+        self._size: Optional[int] = None
+        self._lock = threading.Lock()
+
+    @property
+    def uri(self) -> str:
+        return self._uri
+
+    @property
+    def name(self) -> str:
+        return self.path.name
+
+    @property
+    def description(self) -> str:
+        return self._description
+
+    @property
+    def mime_type(self) -> str:
+        return self._mime_type
+
+    def _open(self) -> None:
+        """Memory-map the backing file."""
+        # The mapping keeps its own descriptor, so the file can be closed right away
+        with open(self.path, "rb") as file:
+            size = os.fstat(file.fileno()).st_size
+            # Zero-length files cannot be mapped
+            if size > 0:
+                self._map = mmap.mmap(file.fileno(), 0, access=mmap.ACCESS_READ)
+        self._size = size
+
+    def size(self) -> int:
+        with self._lock:
+            if self._size is not None:
+                return self._size
+        return self.path.stat().st_size
+
+    def read_range(self, offset: int, length: Optional[int] = None) -> bytes:
+        if offset < 0 or (length is not None and length < 0):
+            raise ValueError("Offset and length must be non-negative")
+        with self._lock:
+            if self._size is None:
+                self._open()
+            if self._map is None:
+                return b""
+            end = self._size if length is None else min(self._size, offset + length)
+            data = self._map[offset:end]
+        # Outside our lock: the pool may close other resources
+        if self._pool is not None:
+            self._pool.touch(self)
+        return data
+
+    def close(self) -> None:
+        """Release the memory mapping; later reads map the file again."""
+        with self._lock:
+            if self._map is not None:
+                self._map.close()
+                self._map = None
+            self._size = None
+        if self._pool is not None:
+            self._pool.discard(self)
+
+class ResourceCache:
+    """Bounded LRU cache holding the full contents of small resources."""
+
+    def __init__(self, max_entries: int = 128, max_entry_bytes: int = 64 * 1024,
+                 max_total_bytes: int = 8 * 1024 * 1024):
+        self.max_entries = max_entries
+        self.max_entry_bytes = max_entry_bytes
+        self.max_total_bytes = max_total_bytes
+        self._entries: "OrderedDict[str, bytes]" = OrderedDict()
+        self._total_bytes = 0
+
+    def is_cacheable(self, resource: BaseResource) -> bool:
+        """Check if a resource is small enough to be cached."""
+        return resource.size() <= self.max_entry_bytes
+
+    def get(self, uri: str) -> Optional[bytes]:
+        """Get cached contents, marking the entry as recently used."""
+        data = self._entries.get(uri)
+        if data is not None:
+            self._entries.move_to_end(uri)
+        return data
+
+    def put(self, uri: str, data: bytes) -> None:
+        """Cache contents, evicting least recently used entries as needed."""
+        if len(data) > self.max_entry_bytes:
+            return
+        self.invalidate(uri)
+        self._entries[uri] = data
+        self._total_bytes += len(data)
+        while len(self._entries) > self.max_entries or self._total_bytes > self.max_total_bytes:
+            _, evicted = self._entries.popitem(last=False)
+            self._total_bytes -= len(evicted)
+
+    def invalidate(self, uri: str) -> None:
+        """Drop a cached entry if present."""
+        data = self._entries.pop(uri, None)
+        if data is not None:
+            self._total_bytes -= len(data)
+
+    def clear(self) -> None:
+        """Drop all cached entries."""
+        self._entries.clear()
+        self._total_bytes = 0
+
+    def __len__(self) -> int:
+        return len(self._entries)
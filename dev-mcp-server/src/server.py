@@ -1,9 +1,27 @@
-from fastapi import FastAPI, Request
-from typing import Dict, Any, Optional, List
+from fastapi import FastAPI, Request, Response
+from fastapi.responses import StreamingResponse
+from typing import Dict, Any, Optional, List, Tuple, Callable, Awaitable
 from pydantic import BaseModel
+from contextlib import asynccontextmanager
+import base64
 import json
+import logging
+import os
+import time
+from capture import TrafficRecorder
 from manifest import ManifestManager
+from prompts.greeting import GreetingPrompt
+from prompts.template import BasePrompt, PromptCache
+from resources.file_resource import BaseResource, FileResource, MappingPool, ResourceCache
 from tools.hello_world import HelloWorldTool
+from tools.result import format_tool_result
+
+logger = logging.getLogger(__name__)
+
+NotificationHandler = Callable[[Dict[str, Any]], Awaitable[None]]
+
+# Largest byte range returned by a single resources/read call
+MAX_READ_BYTES = 1024 * 1024
 
 # JSON-RPC 2.0 Models
 class JsonRpcRequest(BaseModel):
@@ -37,14 +55,35 @@ class ToolCallParams(BaseModel):
     name: str
     arguments: Optional[Dict[str, Any]] = None
 
+class PromptGetParams(BaseModel):
+    name: str
+    arguments: Optional[Dict[str, Any]] = None
+
+class ResourceReadParams(BaseModel):
+    uri: str
+    offset: int = 0
+    length: Optional[int] = None
+
 class MCPServer:
     """MCP Server implementing JSON-RPC 2.0 protocol."""
     
-    def __init__(self):
+    def __init__(self, resource_dir: Optional[str] = None, capture_path: Optional[str] = None,
+                 text_fallback: bool = False):
         self.manifest_manager = ManifestManager()
         self.tools = self._initialize_tools()
+        self.mapping_pool = MappingPool()
+        self.resources = self._initialize_resources(resource_dir)
+        self.resource_cache = ResourceCache()
+        self.prompts = self._initialize_prompts()
+        self.prompts_list = self.manifest_manager.get_prompts(list(self.prompts.values()))
+        self.prompt_cache = PromptCache()
         self.initialized = False
         self.client_info = None
+        self.notification_handlers: Dict[str, NotificationHandler] = {}
+        self.notification_stats = {"handled": 0, "ignored": 0, "failed": 0}
+        self.recorder = TrafficRecorder(capture_path) if capture_path else None
+        # Also send structured tool results as JSON text, for clients that ignore structuredContent
+        self.text_fallback = text_fallback
         
     def _initialize_tools(self) -> Dict[str, Any]:
         """Initialize available tools."""
@@ -53,6 +92,52 @@ class MCPServer:
         tools[hello_world_tool.name] = hello_world_tool
         return tools
     
+    def _initialize_prompts(self) -> Dict[str, BasePrompt]:
+        """Initialize available prompts, compiling their templates."""
+        prompts = {}
+        greeting_prompt = GreetingPrompt()
+        greeting_prompt.compile()
+        prompts[greeting_prompt.name] = greeting_prompt
+        return prompts
+    
+    def register_prompt(self, prompt: BasePrompt) -> None:
+        """Compile and register a prompt so it is served by prompts/*."""
+        prompt.compile()
+        self.prompts[prompt.name] = prompt
+        self.prompts_list = self.manifest_manager.get_prompts(list(self.prompts.values()))
+        self.prompt_cache.clear()
+    
+    def _initialize_resources(self, resource_dir: Optional[str]) -> Dict[str, BaseResource]:
+        """Initialize file resources from a directory."""
+        resources = {}
+        if resource_dir:
+            for root, _, files in os.walk(resource_dir):
+                for filename in sorted(files):
+                    resource = FileResource(os.path.join(root, filename), pool=self.mapping_pool)
+                    resources[resource.uri] = resource
+        return resources
+    
+    def register_resource(self, resource: BaseResource) -> None:
+        """Register a resource so it is served by resources/*."""
+        replaced = self.resources.get(resource.uri)
+        if replaced is not None and replaced is not resource:
+            replaced.close()
+        self.resources[resource.uri] = resource
+        self.resource_cache.invalidate(resource.uri)
+    
+    def _read_resource_bytes(self, resource: BaseResource, offset: int, length: int) -> bytes:
+        """Read a byte range, serving small resources from the cache."""
+        if not self.resource_cache.is_cacheable(resource):
+            return resource.read_range(offset, length)
+        
+        data = self.resource_cache.get(resource.uri)
+        if data is None:
+            data = resource.read_range(0)
+            self.resource_cache.put(resource.uri, data)
+            # Later reads are served from the cache, so the mapping is not needed
+            resource.close()
+        return data[offset:offset + length]
+    
     def _create_error_response(self, request_id: Any, code: int, message: str, data: Any = None) -> JsonRpcResponse:
         """Create JSON-RPC error response."""
         error = JsonRpcError(code=code, message=message, data=data)
@@ -130,15 +215,7 @@ class MCPServer:
             tool_result = await tool.execute(call_params.arguments or {})
             
             # Format result according to MCP spec
-            result = {
-                "content": [
-                    {
-                        "type": "text",
-                        "text": str(tool_result)
-                    }
-                ],
-                "isError": False
-            }
+            result = format_tool_result(tool_result, text_fallback=self.text_fallback)
             
             return self._create_success_response(request_id, result)
             
@@ -155,12 +232,195 @@ class MCPServer:
             }
             return self._create_success_response(request_id, result)
     
+    async def _handle_prompts_list(self, request_id: Any) -> JsonRpcResponse:
+        """Handle prompts/list method."""
+        if not self.initialized:
+            return self._create_error_response(request_id, -32002, "Server not initialized")
+        
+        return self._create_success_response(request_id, {"prompts": self.prompts_list})
+    
+    async def _handle_prompts_get(self, params: Dict[str, Any], request_id: Any) -> JsonRpcResponse:
+        """Handle prompts/get method."""
+        if not self.initialized:
+            return self._create_error_response(request_id, -32002, "Server not initialized")
+        
+        try:
+            get_params = PromptGetParams(**params)
+        except Exception as e:
+            return self._create_error_response(request_id, -32602, f"Invalid params: {str(e)}")
+        
+        prompt = self.prompts.get(get_params.name)
+        if prompt is None:
+            return self._create_error_response(
+                request_id, -32602,
+                f"Prompt not found: {get_params.name}"
+            )
+        
+        try:
+            values = prompt.validate_arguments(get_params.arguments or {})
+        except ValueError as e:
+            return self._create_error_response(request_id, -32602, f"Invalid params: {str(e)}")
+        
+        try:
+            # Keyed on validated values so defaults and explicit values share an entry
+            cache_key = self.prompt_cache.make_key(prompt.name, values)
+            result = self.prompt_cache.get(cache_key)
+            if result is None:
+                result = {
+                    "description": prompt.description,
+                    "messages": [
+                        {
+                            "role": "user",
+                            "content": {
+                                "type": "text",
+                                "text": prompt.render_validated(values)
+                            }
+                        }
+                    ]
+                }
+                self.prompt_cache.put(cache_key, result)
+            
+            return self._create_success_response(request_id, result)
+            
+        except Exception as e:
+            return self._create_error_response(request_id, -32603, f"Internal error: {str(e)}")
+    
+    async def _handle_resources_list(self, request_id: Any) -> JsonRpcResponse:
+        """Handle resources/list method."""
+        if not self.initialized:
+            return self._create_error_response(request_id, -32002, "Server not initialized")
+        
+        try:
+            resources_list = [resource.get_metadata() for resource in self.resources.values()]
+            return self._create_success_response(request_id, {"resources": resources_list})
+            
+        except Exception as e:
+            return self._create_error_response(request_id, -32603, f"Internal error: {str(e)}")
+    
+    async def _handle_resources_read(self, params: Dict[str, Any], request_id: Any) -> JsonRpcResponse:
+        """Handle resources/read method.
+        
+        At most MAX_READ_BYTES are returned per call; `nextOffset` is set when
+        more data remains in the requested range.
+        """
+        if not self.initialized:
+            return self._create_error_response(request_id, -32002, "Server not initialized")
+        
+        try:
+            read_params = ResourceReadParams(**params)
+            if read_params.offset < 0 or (read_params.length is not None and read_params.length < 0):
+                raise ValueError("offset and length must be non-negative")
+        except Exception as e:
+            return self._create_error_response(request_id, -32602, f"Invalid params: {str(e)}")
+        
+        resource = self.resources.get(read_params.uri)
+        if resource is None:
+            return self._create_error_response(
+                request_id, -32602,
+                f"Resource not found: {read_params.uri}"
+            )
+        
+        try:
+            total_size = resource.size()
+            offset = min(read_params.offset, total_size)
+            end = total_size if read_params.length is None else min(total_size, offset + read_params.length)
+            length = min(end - offset, MAX_READ_BYTES)
+            data = self._read_resource_bytes(resource, offset, length)
+            
+            content = {
+                "uri": resource.uri,
+                "mimeType": resource.mime_type,
+                "offset": offset,
+                "length": len(data),
+                "totalSize": total_size
+            }
+            text = self._decode_text(resource.mime_type, data)
+            if text is not None:
+                content["text"] = text
+            else:
+                # Encoded at the transport edge
+                content["blob"] = data
+            
+            result = {"contents": [content]}
+            if offset + len(data) < end:
+                result["nextOffset"] = offset + len(data)
+            return self._create_success_response(request_id, result)
+            
+        except Exception as e:
+            return self._create_error_response(request_id, -32603, f"Internal error: {str(e)}")
+    
+    @staticmethod
+    def _decode_text(mime_type: str, data: bytes) -> Optional[str]:
+        """Decode textual resource data, or return None if it must be sent as a blob."""
+        if not (mime_type.startswith("text/") or mime_type.endswith(("json", "xml"))):
+            return None
+        try:
+            return data.decode("utf-8")
+        except UnicodeDecodeError:
+            # A range may split a multi-byte character
+            return None
+    
     async def _handle_ping(self, request_id: Any) -> JsonRpcResponse:
         """Handle ping method."""
         return self._create_success_response(request_id, {})
     
-    async def handle_jsonrpc_request(self, request_data: Dict[str, Any]) -> JsonRpcResponse:
-        """Handle incoming JSON-RPC request."""
+    async def _dispatch(self, method: str, params: Dict[str, Any], request_id: Any) -> JsonRpcResponse:
+        """Route a request to the appropriate handler."""
+        if method == "initialize":
+            return await self._handle_initialize(params, request_id)
+        elif method == "tools/list":
+            return await self._handle_tools_list(request_id)
+        elif method == "tools/call":
+            return await self._handle_tools_call(params, request_id)
+        elif method == "prompts/list":
+            return await self._handle_prompts_list(request_id)
+        elif method == "prompts/get":
+            return await self._handle_prompts_get(params, request_id)
+        elif method == "resources/list":
+            return await self._handle_resources_list(request_id)
+        elif method == "resources/read":
+            return await self._handle_resources_read(params, request_id)
+        elif method == "ping":
+            return await self._handle_ping(request_id)
+        else:
+            return self._create_error_response(
+                request_id, -32601, f"Method not found: {method}"
+            )
+    
+    def register_notification_handler(self, method: str, handler: NotificationHandler) -> None:
+        """Register an async handler for a notification method."""
+        self.notification_handlers[method] = handler
+    
+    async def _handle_notification(self, request_data: Dict[str, Any]) -> None:
+        """Handle a JSON-RPC notification.
+        
+        Notifications never get a response. Registered handlers run without
+        one being built; anything else, including regular methods sent
+        without an id, is ignored. Failures are logged and counted.
+        """
+        method = request_data.get("method")
+        handler = self.notification_handlers.get(method)
+        if request_data.get("jsonrpc") != "2.0" or handler is None:
+            self.notification_stats["ignored"] += 1
+            logger.debug("Ignoring notification: %s", method)
+            return
+        
+        try:
+            await handler(request_data.get("params") or {})
+            self.notification_stats["handled"] += 1
+        except Exception:
+            self.notification_stats["failed"] += 1
+            logger.exception("Notification handler failed: %s", method)
+    
+    async def handle_jsonrpc_request(self, request_data: Dict[str, Any]) -> Optional[JsonRpcResponse]:
+        """Handle incoming JSON-RPC request.
+        
+        Returns None for notifications (requests without an `id` member).
+        """
+        if isinstance(request_data, dict) and "id" not in request_data:
+            await self._handle_notification(request_data)
+            return None
+        
         try:
             # Validate JSON-RPC structure
             if request_data.get("jsonrpc") != "2.0":
@@ -172,63 +432,177 @@ class MCPServer:
             params = request_data.get("params", {})
             request_id = request_data.get("id")
             
-            # Route to appropriate handler
-            if method == "initialize":
-                return await self._handle_initialize(params, request_id)
-            elif method == "tools/list":
-                return await self._handle_tools_list(request_id)
-            elif method == "tools/call":
-                return await self._handle_tools_call(params, request_id)
-            elif method == "ping":
-                return await self._handle_ping(request_id)
-            else:
-                return self._create_error_response(
-                    request_id, -32601, f"Method not found: {method}"
-                )
+            return await self._dispatch(method, params, request_id)
                 
         except Exception as e:
             return self._create_error_response(
                 request_data.get("id"), -32700, f"Parse error: {str(e)}"
             )
     
+    async def handle_http_body(self, body: bytes) -> Response:
+        """Handle a raw JSON-RPC HTTP body holding a single request or a batch."""
+        try:
+            request_data = json.loads(body)
+            
+            # Handle single request
+            if isinstance(request_data, dict):
+                response = await self.handle_jsonrpc_request(request_data)
+                if response is None:
+                    return Response(status_code=202)
+                return _json_response(response.dict(exclude_none=True))
+            
+            # Handle batch requests
+            elif isinstance(request_data, list) and request_data:
+                responses = []
+                for req in request_data:
+                    if not isinstance(req, dict):
+                        error_response = self._create_error_response(None, -32600, "Invalid Request")
+                        responses.append(error_response.dict(exclude_none=True))
+                        continue
+                    response = await self.handle_jsonrpc_request(req)
+                    if response is not None:
+                        responses.append(response.dict(exclude_none=True))
+                # A batch of only notifications gets no response body
+                if not responses:
+                    return Response(status_code=202)
+                return _json_response(responses)
+            
+            else:
+                error_response = self._create_error_response(None, -32600, "Invalid Request")
+                return _json_response(error_response.dict(exclude_none=True))
+                
+        except json.JSONDecodeError:
+            error_response = self._create_error_response(None, -32700, "Parse error")
+            return _json_response(error_response.dict(exclude_none=True))
+        except Exception as e:
+            error_response = self._create_error_response(None, -32603, f"Internal error: {str(e)}")
+            return _json_response(error_response.dict(exclude_none=True))
+    
     def create_app(self) -> FastAPI:
         """Create and configure FastAPI application."""
-        app = FastAPI(title="MCP Development Server")
+        @asynccontextmanager
+        async def lifespan(app: FastAPI):
+            yield
+            if self.recorder is not None:
+                self.recorder.close()
+        
+        app = FastAPI(title="MCP Development Server", lifespan=lifespan)
         
         @app.get("/health")
         async def health_check():
             return {"status": "healthy"}
         
+        @app.get("/resources/stream")
+        async def stream_resource(uri: str, request: Request):
+            """Stream a resource in chunks, honouring an HTTP Range header.
+            
+            Gated on initialization like resources/read; errors are sent as a
+            JSON-RPC error body with an HTTP error status.
+            """
+            if not self.initialized:
+                error_response = self._create_error_response(None, -32002, "Server not initialized")
+                return _json_response(error_response.dict(exclude_none=True), status_code=403)
+            
+            resource = self.resources.get(uri)
+            if resource is None:
+                return Response(status_code=404)
+            
+            total_size = resource.size()
+            byte_range = _parse_range_header(request.headers.get("range"), total_size)
+            if byte_range is None:
+                return Response(status_code=416, headers={"Content-Range": f"bytes */{total_size}"})
+            
+            start, end = byte_range
+            headers = {"Accept-Ranges": "bytes", "Content-Length": str(end - start)}
+            status_code = 200
+            if "range" in request.headers:
+                headers["Content-Range"] = f"bytes {start}-{end - 1}/{total_size}"
+                status_code = 206
+            
+            return StreamingResponse(
+                resource.iter_chunks(start, end - start),
+                status_code=status_code,
+                media_type=resource.mime_type,
+                headers=headers
+            )
+        
         @app.post("/")
         async def mcp_handler(request: Request):
             """Main MCP JSON-RPC endpoint."""
+            body = await request.body()
+            arrived_at = time.time()
+            started = time.perf_counter()
+            response = await self.handle_http_body(body)
+            
+            if self.recorder is not None:
+                self.recorder.record(
+                    body, arrived_at, time.perf_counter() - started,
+                    len(response.body), response.status_code
+                )
+            return response
+        
+        
+        return app
+
+def _encode_binary(value: Any) -> str:
+    """Base64-encode binary buffers left in a response payload."""
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(value).decode("ascii")
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _dumps(payload: Any) -> str:
+    return json.dumps(payload, default=_encode_binary, separators=(",", ":"))
+
+def _json_response(payload: Any, status_code: int = 200) -> Response:
+    """Serialize a JSON-RPC payload, encoding binary data exactly once.
+    
+    If the payload cannot be serialized, each response is serialized on its
+    own and the ones that fail are replaced by an internal error carrying
+    their id, so one bad result cannot take down a whole batch.
+    """
+    try:
+        body = _dumps(payload)
+    except (TypeError, ValueError):
+        entries = payload if isinstance(payload, list) else [payload]
+        bodies = []
+        for entry in entries:
             try:
-                body = await request.body()
-                request_data = json.loads(body)
-                
-                # Handle single request
-                if isinstance(request_data, dict):
-                    response = await self.handle_jsonrpc_request(request_data)
-                    return response.dict(exclude_none=True)
-                
-                # Handle batch requests
-                elif isinstance(request_data, list):
-                    responses = []
-                    for req in request_data:
-                        response = await self.handle_jsonrpc_request(req)
-                        responses.append(response.dict(exclude_none=True))
-                    return responses
-                
-                else:
-                    error_response = self._create_error_response(None, -32600, "Invalid Request")
-                    return error_response.dict(exclude_none=True)
-                    
-            except json.JSONDecodeError:
-                error_response = self._create_error_response(None, -32700, "Parse error")
-                return error_response.dict(exclude_none=True)
-            except Exception as e:
-                error_response = self._create_error_response(None, -32603, f"Internal error: {str(e)}")
-                return error_response.dict(exclude_none=True)
-        
-        
-        return app
\ No newline at end of file
+                bodies.append(_dumps(entry))
+            except (TypeError, ValueError) as e:
+                bodies.append(_dumps({
+                    "jsonrpc": "2.0",
+                    "error": {"code": -32603, "message": f"Internal error: {str(e)}"},
+                    "id": entry.get("id") if isinstance(entry, dict) else None
+                }))
+        body = "[" + ",".join(bodies) + "]" if isinstance(payload, list) else bodies[0]
+    return Response(content=body, status_code=status_code, media_type="application/json")
+
+def _parse_range_header(header: Optional[str], total_size: int) -> Optional[Tuple[int, int]]:
+    """Parse a single `bytes=` range into a half-open (start, end) pair.
+    
+    Returns the full resource when no header is given and None when the range
+    is malformed or unsatisfiable.
+    """
+    if not header:
+        return 0, total_size
+    
+    unit, _, spec = header.partition("=")
+    if unit.strip() != "bytes" or "," in spec:
+        return None
+    
+    first, _, last = spec.strip().partition("-")
+    try:
+        if not first:
+            # Suffix range: the final N bytes
+            suffix = int(last)
+            if suffix <= 0:
+                return None
+            return max(0, total_size - suffix), total_size
+        start = int(first)
+        end = total_size if not last else min(total_size, int(last) + 1)
+    except ValueError:
+        return None
+    
+    if start >= total_size or start >= end:
+        return None
+    return start, end
@@ -16,6 +16,11 @@ class BaseTool(ABC):
         """Tool description."""
         pass
     
+    @property
+    def annotations(self) -> Dict[str, Any]:
+        """Behaviour hints such as idempotentHint, advertised in tools/list."""
+        return {}
+    
     @abstractmethod
     async def execute(self, parameters: Dict[str, Any]) -> Any:
         """Execute the tool with given parameters."""
@@ -37,6 +42,10 @@ class HelloWorldTool(BaseTool):
     def description(self) -> str:
         return "A simple hello world tool that greets users"
     
+    @property
+    def annotations(self) -> Dict[str, Any]:
+        return {"readOnlyHint": True, "idempotentHint": True}
+    
     async def execute(self, parameters: Dict[str, Any]) -> str:
         """Execute hello world functionality."""
         name = parameters.get("name", "World")
@@ -0,0 +1,150 @@
+import base64
+import datetime
+import decimal
+import enum
+import json
+import uuid
+from typing import Dict, Any, List, Union
+
+Binary = Union[bytes, bytearray, memoryview]
+
+JSON_TYPES = (dict, list, tuple, int, float, bool)
+
+class ContentPart(dict):
+    """A content part built by one of the helpers below."""
+    pass
+
+def text_content(text: str) -> ContentPart:
+    """Build a text content part."""
+    return ContentPart(type="text", text=text)
+
+def image_content(data: Binary, mime_type: str = "image/png") -> ContentPart:
+    """Build an image content part.
+
+    The buffer is kept as-is and only base64-encoded when the response is
+    serialized at the transport edge.
+    """
+    return ContentPart(type="image", data=memoryview(data), mimeType=mime_type)
+
+def blob_content(data: Binary, mime_type: str = "application/octet-stream",
+                 uri: str = "blob:tool-result") -> ContentPart:
+    """Build an embedded resource part carrying binary data.
+
+    Like images, the buffer is only base64-encoded at the transport edge.
+    """
+    return ContentPart(
+        type="resource",
+        resource={"uri": uri, "mimeType": mime_type, "blob": memoryview(data)}
+    )
+
+def _json_safe(value: Any) -> Any:
+    """Convert a value into one `json.dumps` accepts without a `default`.
+
+    Binary buffers become base64 strings, dates ISO 8601 strings, decimals and
+    UUIDs strings, and sets and tuples lists. Containers are only copied when
+    something inside them had to change, so native JSON passes through as-is.
+    Raises TypeError for anything else.
+    """
+    if isinstance(value, enum.Enum):
+        return _json_safe(value.value)
+    if value is None or isinstance(value, (str, int, float)):
+        return value
+    if isinstance(value, dict):
+        converted = {}
+        changed = False
+        for key, item in value.items():
+            safe_key = key if isinstance(key, str) else _json_key(key)
+            safe_item = _json_safe(item)
+            changed = changed or safe_key is not key or safe_item is not item
+            converted[safe_key] = safe_item
+        return converted if changed else value
+    if isinstance(value, list):
+        items = [_json_safe(item) for item in value]
+        return items if any(new is not old for new, old in zip(items, value)) else value
+    if isinstance(value, (tuple, set, frozenset)):
+        return [_json_safe(item) for item in value]
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return base64.b64encode(value).decode("ascii")
+    if isinstance(value, (datetime.date, datetime.time)):
+        return value.isoformat()
+    if isinstance(value, (decimal.Decimal, uuid.UUID)):
+        return str(value)
+    raise TypeError(f"Object of type {type(value).__name__} is not JSON serializable")
+
+def _json_key(key: Any) -> str:
+    if key is None or isinstance(key, (int, float)):
+        # Same spelling json.dumps uses for non-string keys
+        return json.dumps(key)
+    raise TypeError(f"Keys must be str, int, float, bool or None, not {type(key).__name__}")
+
+def _json_text(data: Any) -> str:
+    """Serialize JSON-safe data compactly."""
+    return json.dumps(data, separators=(",", ":"))
+
+def to_content(value: Any) -> ContentPart:
+    """Convert a single tool return value into a content part."""
+    if isinstance(value, ContentPart):
+        return value
+    if isinstance(value, str):
+        return text_content(value)
+    if isinstance(value, (bytes, bytearray, memoryview)):
+        return blob_content(value)
+    if value is None or isinstance(value, JSON_TYPES):
+        try:
+            return text_content(_json_text(_json_safe(value)))
+        except (TypeError, ValueError):
+            pass
+    return text_content(str(value))
+
+class ToolResult:
+    """Multi-part tool result.
+
+    Tools may return a ToolResult to send several content parts at once, and
+    pass `structured` to return native JSON in `structuredContent`. Plain
+    return values are converted by `format_tool_result`.
+
+    A JSON text copy of `structured` is only added to `content` when
+    `text_fallback` is set, for clients that ignore structuredContent.
+    """
+
+    def __init__(self, *parts: Any, structured: Any = None, is_error: bool = False,
+                 text_fallback: bool = False):
+        self.content: List[ContentPart] = [to_content(part) for part in parts]
+        self.structured = structured
+        self.is_error = is_error
+        self.text_fallback = text_fallback
+
+    def to_dict(self) -> Dict[str, Any]:
+        """Format result according to MCP spec."""
+        result: Dict[str, Any] = {"content": self.content, "isError": self.is_error}
+        if self.structured is None:
+            return result
+
+        try:
+            structured = _json_safe(self.structured)
+        except TypeError:
+            # Not representable as JSON, so send its string form as before
+            result["content"] = self.content + [text_content(str(self.structured))]
+            return result
+
+        # structuredContent must be an object; other values are wrapped
+        if not isinstance(structured, dict):
+            structured = {"result": structured}
+        result["structuredContent"] = structured
+        if self.text_fallback and not self.content:
+            result["content"] = [text_content(_json_text(structured))]
+        return result
+
+def format_tool_result(tool_result: Any, text_fallback: bool = False) -> Dict[str, Any]:
+    """Format any tool return value as an MCP tools/call result.
+
+    Strings become text, binary data an embedded resource, and JSON-compatible
+    values are returned as structuredContent, with a JSON text copy only when
+    `text_fallback` is set. Values that cannot be made JSON-safe fall back to
+    their string form.
+    """
+    if isinstance(tool_result, ToolResult):
+        return tool_result.to_dict()
+    if isinstance(tool_result, JSON_TYPES):
+        return ToolResult(structured=tool_result, text_fallback=text_fallback).to_dict()
+    return ToolResult(tool_result).to_dict()
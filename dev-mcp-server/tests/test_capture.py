@@ -0,0 +1,72 @@
+import sys
+import time
+from types import SimpleNamespace
+from fastapi.testclient import TestClient
+from src.capture import TrafficRecorder, load_capture, message_method
+from src.server import MCPServer
+
+def test_recorder_writes_jsonl(tmp_path):
+    """Test recorded requests are written as JSONL on close."""
+    path = tmp_path / "capture.jsonl"
+    recorder = TrafficRecorder(str(path))
+    recorder.record(b'{"jsonrpc": "2.0", "method": "ping", "id": 1}', 100.0, 0.002, 36, 200)
+    recorder.record(b"not json", 100.5, 0.001, 52, 200)
+    recorder.close()
+    
+    records = load_capture(str(path))
+    assert len(records) == 2
+    assert records[0]["message"]["method"] == "ping"
+    assert records[0]["durationMs"] == 2.0
+    assert records[0]["responseBytes"] == 36
+    assert records[1]["message"] == "not json"
+
+def test_recorder_drops_when_full(tmp_path):
+    """Test records are dropped instead of blocking when the queue is full."""
+    recorder = TrafficRecorder(str(tmp_path / "capture.jsonl"), max_queue=1)
+    # With the writer stopped nothing drains the queue
+    recorder.close()
+    
+    recorder.record(b"{}", 0.0, 0.0, 0, 200)
+    recorder.record(b"{}", 0.0, 0.0, 0, 200)
+    
+    assert recorder.dropped == 1
+
+def test_server_captures_traffic(tmp_path):
+    """Test the server records each HTTP request with its response size."""
+    path = tmp_path / "capture.jsonl"
+    server = MCPServer(capture_path=str(path))
+    with TestClient(server.create_app()) as client:
+        response = client.post("/", json={"jsonrpc": "2.0", "method": "ping", "id": 1})
+        client.post("/", json={"jsonrpc": "2.0", "method": "notifications/message"})
+    
+    records = load_capture(str(path))
+    assert [message_method(record["message"]) for record in records] == ["ping", "notifications/message"]
+    assert records[0]["responseBytes"] == len(response.content)
+    assert records[1]["status"] == 202
+
+def test_server_records_arrival_time(tmp_path, monkeypatch):
+    """Test the capture timestamp is taken before the request is handled."""
+    path = tmp_path / "capture.jsonl"
+    server = MCPServer(capture_path=str(path))
+    clock = {"now": 100.0}
+    monkeypatch.setattr(
+        sys.modules[MCPServer.__module__], "time",
+        SimpleNamespace(time=lambda: clock["now"], perf_counter=time.perf_counter)
+    )
+    original_handle = server.handle_http_body
+    
+    async def slow_handle(body):
+        clock["now"] = 105.0
+        return await original_handle(body)
+    
+    monkeypatch.setattr(server, "handle_http_body", slow_handle)
+    with TestClient(server.create_app()) as client:
+        client.post("/", json={"jsonrpc": "2.0", "method": "ping", "id": 1})
+    
+    assert load_capture(str(path))[0]["timestamp"] == 100.0
+
+def test_message_method():
+    """Test method extraction from captured messages."""
+    assert message_method({"method": "tools/call"}) == "tools/call"
+    assert message_method([{"method": "ping"}]) == "batch"
+    assert message_method("garbage") is None
@@ -0,0 +1,110 @@
+import threading
+import pytest
+from src.resources.file_resource import FileResource, MappingPool, ResourceCache
+
+@pytest.fixture
+def file_resource(tmp_path):
+    path = tmp_path / "data.bin"
+    path.write_bytes(bytes(range(256)) * 4)
+    resource = FileResource(str(path))
+    yield resource
+    resource.close()
+
+def test_resource_properties(file_resource):
+    """Test resource basic properties."""
+    assert file_resource.name == "data.bin"
+    assert file_resource.uri.startswith("file://")
+    assert file_resource.size() == 1024
+
+def test_read_range(file_resource):
+    """Test reading a byte range from the mapped file."""
+    assert file_resource.read_range(10, 5) == bytes(range(10, 15))
+    assert file_resource.read_range(1020) == bytes(range(252, 256))
+    assert file_resource.read_range(2000, 10) == b""
+
+def test_iter_chunks(file_resource):
+    """Test chunked iteration over a range."""
+    chunks = list(file_resource.iter_chunks(100, 300, chunk_size=128))
+    assert [len(chunk) for chunk in chunks] == [128, 128, 44]
+    assert b"".join(chunks) == file_resource.read_range(100, 300)
+
+def test_empty_file(tmp_path):
+    """Test that empty files can be read."""
+    path = tmp_path / "empty.txt"
+    path.write_bytes(b"")
+    resource = FileResource(str(path))
+    assert resource.read_range(0) == b""
+    assert list(resource.iter_chunks()) == []
+
+def test_cache_evicts_least_recently_used():
+    """Test LRU eviction in the resource cache."""
+    cache = ResourceCache(max_entries=2)
+    cache.put("a", b"1")
+    cache.put("b", b"2")
+    cache.get("a")
+    cache.put("c", b"3")
+
+    assert cache.get("a") == b"1"
+    assert cache.get("b") is None
+    assert len(cache) == 2
+
+def test_cache_respects_byte_limits():
+    """Test cache entry and total size limits."""
+    cache = ResourceCache(max_entry_bytes=4, max_total_bytes=6)
+    cache.put("big", b"12345")
+    assert cache.get("big") is None
+
+    cache.put("a", b"1234")
+    cache.put("b", b"1234")
+    assert cache.get("a") is None
+    assert cache.get("b") == b"1234"
+
+def test_concurrent_first_reads_open_once(file_resource, monkeypatch):
+    """Test concurrent first reads map the file only once."""
+    opened = []
+    original_open = file_resource._open
+    
+    def counting_open():
+        opened.append(1)
+        original_open()
+    
+    monkeypatch.setattr(file_resource, "_open", counting_open)
+    threads = [threading.Thread(target=file_resource.read_range, args=(0, 10)) for _ in range(8)]
+    for thread in threads:
+        thread.start()
+    for thread in threads:
+        thread.join()
+    
+    assert len(opened) == 1
+
+def test_read_after_close_reopens(file_resource):
+    """Test a closed resource can be read again."""
+    assert file_resource.read_range(0, 2) == b"\x00\x01"
+    file_resource.close()
+    assert file_resource.read_range(2, 2) == b"\x02\x03"
+
+def test_mapping_does_not_keep_file_open(file_resource):
+    """Test the file is closed once mapped; only the mapping stays open."""
+    file_resource.read_range(0, 1)
+    assert not hasattr(file_resource, "_file")
+    assert file_resource._map is not None
+
+def test_pool_closes_least_recently_used(tmp_path):
+    """Test the mapping pool bounds the number of open mappings."""
+    pool = MappingPool(max_mappings=2)
+    resources = []
+    for index in range(3):
+        path = tmp_path / f"{index}.bin"
+        path.write_bytes(b"abc")
+        resources.append(FileResource(str(path), pool=pool))
+    
+    resources[0].read_range(0, 1)
+    resources[1].read_range(0, 1)
+    resources[0].read_range(1, 1)
+    resources[2].read_range(0, 1)
+    
+    assert len(pool) == 2
+    assert resources[1]._map is None
+    assert resources[0]._map is not None
+    assert resources[1].read_range(2, 1) == b"c"
+    assert resources[0]._map is None
@@ -26,4 +26,10 @@ def test_empty_manifest(manifest_manager):
     
     assert "version" in manifest
     assert "tools" in manifest
-    assert len(manifest["tools"]) == 0
\ No newline at end of file
+    assert len(manifest["tools"]) == 0
+
+def test_manifest_includes_annotations(manifest_manager, hello_world_tool):
+    """Test tool annotations are included in the manifest."""
+    manifest = manifest_manager.get_manifest([hello_world_tool])
+    
+    assert manifest["tools"][0]["annotations"]["idempotentHint"] is True
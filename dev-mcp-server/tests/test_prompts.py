@@ -0,0 +1,46 @@
+import pytest
+from src.prompts.greeting import GreetingPrompt
+from src.prompts.template import CompiledTemplate, PromptCache
+
+@pytest.fixture
+def greeting_prompt():
+    prompt = GreetingPrompt()
+    prompt.compile()
+    return prompt
+
+def test_compiled_template_render():
+    """Test rendering a compiled template with escaped braces."""
+    template = CompiledTemplate("Hi {name}, use {{braces}}")
+    assert template.fields == {"name"}
+    assert template.render({"name": "Ada"}) == "Hi Ada, use {braces}"
+
+def test_compiled_template_rejects_format_spec():
+    """Test that format specs are rejected at compile time."""
+    with pytest.raises(ValueError):
+        CompiledTemplate("{name:>10}")
+
+def test_render_with_default(greeting_prompt):
+    """Test optional arguments fall back to their default."""
+    assert greeting_prompt.render({"name": "Ada"}) == "Write a short, friendly greeting for Ada."
+
+def test_render_validates_arguments(greeting_prompt):
+    """Test missing, unknown and non-string arguments are rejected."""
+    with pytest.raises(ValueError, match="Missing required argument"):
+        greeting_prompt.render({})
+    with pytest.raises(ValueError, match="Unknown arguments"):
+        greeting_prompt.render({"name": "Ada", "mood": "happy"})
+    with pytest.raises(ValueError, match="must be a string"):
+        greeting_prompt.render({"name": 1})
+
+def test_prompt_cache_evicts_least_recently_used():
+    """Test LRU eviction in the prompt cache."""
+    cache = PromptCache(max_entries=2)
+    keys = [cache.make_key("p", {"n": str(i)}) for i in range(3)]
+    cache.put(keys[0], {"i": 0})
+    cache.put(keys[1], {"i": 1})
+    cache.get(keys[0])
+    cache.put(keys[2], {"i": 2})
+    
+    assert cache.get(keys[0]) == {"i": 0}
+    assert cache.get(keys[1]) is None
+    assert len(cache) == 2
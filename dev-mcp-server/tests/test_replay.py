@@ -0,0 +1,73 @@
+import httpx
+import pytest
+from src.replay import compare, percentile, replay, summarize
+from src.server import MCPServer
+
+@pytest.fixture
+def records():
+    initialize = {
+        "jsonrpc": "2.0",
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "test", "version": "1.0.0"}
+        },
+        "id": 1
+    }
+    return [
+        {"timestamp": 10.0, "message": initialize},
+        {"timestamp": 10.01, "message": {"jsonrpc": "2.0", "method": "tools/list", "id": 2}},
+        {"timestamp": 10.02, "message": {"jsonrpc": "2.0", "method": "notifications/message"}}
+    ]
+
+def test_percentile():
+    """Test nearest-rank percentiles."""
+    values = [float(i) for i in range(1, 101)]
+    assert percentile(values, 50) == 50.0
+    assert percentile(values, 99) == 99.0
+    assert percentile([3.0], 90) == 3.0
+
+@pytest.mark.asyncio
+async def test_replay_in_process(records):
+    """Test replaying a capture against an in-process server."""
+    transport = httpx.ASGITransport(app=MCPServer().create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://replay") as client:
+        results = await replay(records, client, speedup=10)
+    
+    assert [result["method"] for result in results] == ["initialize", "tools/list", "notifications/message"]
+    assert [result["status"] for result in results] == [200, 200, 202]
+    
+    summary = summarize(results)
+    assert summary["all"]["count"] == 3
+    assert summary["all"]["errors"] == 0
+    assert summary["tools/list"]["responseBytes"] > 0
+
+@pytest.mark.asyncio
+async def test_replay_counts_rpc_errors(records):
+    """Test JSON-RPC errors are counted even with a 200 status."""
+    transport = httpx.ASGITransport(app=MCPServer().create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://replay") as client:
+        results = await replay(records[1:2], client, speedup=0)
+    
+    assert results[0]["status"] == 200
+    assert summarize(results)["tools/list"]["errors"] == 1
+
+@pytest.mark.asyncio
+async def test_replay_sorts_by_arrival(records):
+    """Test out-of-order capture records are replayed in arrival order."""
+    transport = httpx.ASGITransport(app=MCPServer().create_app())
+    async with httpx.AsyncClient(transport=transport, base_url="http://replay") as client:
+        results = await replay(list(reversed(records)), client, speedup=10)
+    
+    assert [result["method"] for result in results] == ["initialize", "tools/list", "notifications/message"]
+    assert [result["status"] for result in results] == [200, 200, 202]
+
+def test_compare_with_baseline():
+    """Test relative latency change against a baseline."""
+    baseline = {"ping": {"p50Ms": 2.0, "p99Ms": 10.0}}
+    summary = {"ping": {"p50Ms": 3.0, "p99Ms": 5.0}, "tools/list": {"p50Ms": 1.0, "p99Ms": 1.0}}
+    
+    diff = compare(summary, baseline)
+    
+    assert diff == {"ping": {"p50Ms": 0.5, "p99Ms": -0.5}}
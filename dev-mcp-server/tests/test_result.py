@@ -0,0 +1,86 @@
+import base64
+import datetime
+import decimal
+import uuid
+from src.tools.result import ToolResult, blob_content, format_tool_result, image_content, text_content
+
+def test_string_result():
+    """Test plain strings become a single text part."""
+    result = format_tool_result("Hello, World!")
+    assert result == {"content": [{"type": "text", "text": "Hello, World!"}], "isError": False}
+
+def test_structured_result():
+    """Test dicts are returned as structuredContent without a text copy."""
+    data = {"items": [1, 2, 3], "ok": True}
+    result = format_tool_result(data)
+    assert result["structuredContent"] is data
+    assert result["content"] == []
+
+def test_structured_text_fallback_is_opt_in():
+    """Test the JSON text copy is only added when requested."""
+    result = format_tool_result({"items": [1, 2, 3], "ok": True}, text_fallback=True)
+    assert result["content"] == [{"type": "text", "text": '{"items":[1,2,3],"ok":true}'}]
+
+def test_non_object_structured_result_is_wrapped():
+    """Test lists are wrapped because structuredContent must be an object."""
+    result = format_tool_result([1, 2], text_fallback=True)
+    assert result["structuredContent"] == {"result": [1, 2]}
+    assert result["content"][0]["text"] == '{"result":[1,2]}'
+
+def test_non_json_native_values_are_converted():
+    """Test dates, decimals, UUIDs, sets and nested bytes become JSON-safe."""
+    when = datetime.datetime(2024, 11, 5, 12, 30)
+    ident = uuid.UUID(int=1)
+    result = format_tool_result({
+        "when": when,
+        "price": decimal.Decimal("9.99"),
+        "id": ident,
+        "tags": {"a"},
+        "raw": b"\x00\x01",
+        1: "one"
+    }, text_fallback=True)
+    structured = result["structuredContent"]
+    assert structured == {
+        "when": "2024-11-05T12:30:00",
+        "price": "9.99",
+        "id": str(ident),
+        "tags": ["a"],
+        "raw": base64.b64encode(b"\x00\x01").decode("ascii"),
+        "1": "one"
+    }
+    # The text copy encodes nested buffers the same way
+    assert '"raw":"AAE="' in result["content"][0]["text"]
+
+def test_unserializable_structured_falls_back_to_text():
+    """Test values that cannot be made JSON-safe are sent as their string form."""
+    value = {"handle": object()}
+    result = format_tool_result(value)
+    assert "structuredContent" not in result
+    assert result["content"] == [{"type": "text", "text": str(value)}]
+
+def test_binary_result_is_not_copied():
+    """Test binary buffers become an embedded resource without being encoded."""
+    payload = bytearray(b"\x00\x01\x02")
+    part = format_tool_result(payload)["content"][0]
+    assert part["type"] == "resource"
+    assert part["resource"]["mimeType"] == "application/octet-stream"
+    assert isinstance(part["resource"]["blob"], memoryview)
+    assert part["resource"]["blob"].obj is payload
+
+def test_multi_part_result():
+    """Test ToolResult with several content parts and structured data."""
+    result = format_tool_result(ToolResult(
+        text_content("summary"),
+        image_content(b"png"),
+        blob_content(b"raw", mime_type="application/pdf", uri="file:///report.pdf"),
+        structured={"count": 2}
+    ))
+    assert [part["type"] for part in result["content"]] == ["text", "image", "resource"]
+    assert result["content"][1]["mimeType"] == "image/png"
+    assert result["content"][2]["resource"]["uri"] == "file:///report.pdf"
+    assert result["structuredContent"] == {"count": 2}
+
+def test_dict_shaped_like_content_is_data():
+    """Test dicts shaped like content parts are still treated as data."""
+    result = format_tool_result({"type": "text", "text": "x"})
+    assert result["structuredContent"] == {"type": "text", "text": "x"}
@@ -1,6 +1,10 @@
+import base64
+import datetime
+import sys
 import pytest
 from fastapi.testclient import TestClient
 from src.server import MCPServer
+from src.resources.file_resource import FileResource
 
 @pytest.fixture
 def client():
@@ -44,4 +48,343 @@ def test_helloworld_endpoint_no_parameters(client):
     
     data = response.json()
     assert data["status"] == "success"
-    assert data["result"] == "Hello, World!"
\ No newline at end of file
+    assert data["result"] == "Hello, World!"
+
+@pytest.fixture
+def resource_client(tmp_path):
+    (tmp_path / "notes.txt").write_text("hello resources")
+    (tmp_path / "data.bin").write_bytes(bytes(range(256)))
+    server = MCPServer(resource_dir=str(tmp_path))
+    client = TestClient(server.create_app())
+    client.post("/", json={
+        "jsonrpc": "2.0",
+        "method": "initialize",
+        "params": {
+            "protocolVersion": "2024-11-05",
+            "capabilities": {},
+            "clientInfo": {"name": "test", "version": "1.0.0"}
+        },
+        "id": 1
+    })
+    client.uris = {resource.name: uri for uri, resource in server.resources.items()}
+    client.server = server
+    return client
+
+def test_resources_list(resource_client):
+    """Test resources/list returns registered files."""
+    response = resource_client.post("/", json={"jsonrpc": "2.0", "method": "resources/list", "id": 2})
+    resources = response.json()["result"]["resources"]
+    
+    names = {resource["name"]: resource for resource in resources}
+    assert names["notes.txt"]["mimeType"] == "text/plain"
+    assert names["data.bin"]["size"] == 256
+
+def test_resources_read_text_range(resource_client):
+    """Test resources/read with offset and length on a text resource."""
+    response = resource_client.post("/", json={
+        "jsonrpc": "2.0",
+        "method": "resources/read",
+        "params": {"uri": resource_client.uris["notes.txt"], "offset": 6, "length": 9},
+        "id": 3
+    })
+    content = response.json()["result"]["contents"][0]
+    
+    assert content["text"] == "resources"
+    assert content["offset"] == 6
+    assert content["totalSize"] == 15
+
+def test_resources_read_blob(resource_client):
+    """Test resources/read returns binary data as base64."""
+    response = resource_client.post("/", json={
+        "jsonrpc": "2.0",
+        "method": "resources/read",
+        "params": {"uri": resource_client.uris["data.bin"], "offset": 250},
+        "id": 4
+    })
+    content = response.json()["result"]["contents"][0]
+    
+    assert base64.b64decode(content["blob"]) == bytes(range(250, 256))
+
+def test_resources_read_not_found(resource_client):
+    """Test resources/read with an unknown URI."""
+    response = resource_client.post("/", json={
+        "jsonrpc": "2.0",
+        "method": "resources/read",
+        "params": {"uri": "file:///missing"},
+        "id": 5
+    })
+    assert response.json()["error"]["code"] == -32602
+
+def test_resources_stream_range(resource_client):
+    """Test streaming a resource with an HTTP Range header."""
+    response = resource_client.get(
+        "/resources/stream",
+        params={"uri": resource_client.uris["data.bin"]},
+        headers={"Range": "bytes=16-31"}
+    )
+    assert response.status_code == 206
+    assert response.headers["content-range"] == "bytes 16-31/256"
+    assert response.content == bytes(range(16, 32))
+
+def test_resources_stream_unsatisfiable_range(resource_client):
+    """Test streaming with a range past the end of the resource."""
+    response = resource_client.get(
+        "/resources/stream",
+        params={"uri": resource_client.uris["data.bin"]},
+        headers={"Range": "bytes=300-"}
+    )
+    assert response.status_code == 416
+
+def test_resources_stream_requires_initialize(tmp_path):
+    """Test raw streaming is gated on initialization like resources/read."""
+    (tmp_path / "data.bin").write_bytes(b"abc")
+    server = MCPServer(resource_dir=str(tmp_path))
+    client = TestClient(server.create_app())
+    uri = next(iter(server.resources))
+    
+    response = client.get("/resources/stream", params={"uri": uri})
+    assert response.status_code == 403
+    assert response.json()["error"]["code"] == -32002
+
+def test_cached_resource_releases_mapping(resource_client):
+    """Test small resources drop their mapping once their bytes are cached."""
+    uri = resource_client.uris["notes.txt"]
+    resource_client.post("/", json={
+        "jsonrpc": "2.0",
+        "method": "resources/read",
+        "params": {"uri": uri},
+        "id": 6
+    })
+    resource = resource_client.server.resources[uri]
+    assert resource._map is None
+    assert len(resource_client.server.mapping_pool) == 0
+
+def test_tools_call_binary_result(monkeypatch):
+    """Test binary tool results are base64-encoded in the HTTP response."""
+    async def execute(parameters):
+        return b"\x00\xff"
+    
+    server = MCPServer()
+    monkeypatch.setattr(server.tools["helloworld"], "execute", execute)
+    client = TestClient(server.create_app())
+    server.initialized = True
+    
+    response = client.post("/", json={
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {"name": "helloworld"},
+        "id": 6
+    })
+    content = response.json()["result"]["content"]
+    
+    assert content[0]["type"] == "resource"
+    assert base64.b64decode(content[0]["resource"]["blob"]) == b"\x00\xff"
+
+def test_tools_call_datetime_result(monkeypatch):
+    """Test tool results holding non-JSON-native values keep their request id."""
+    async def execute(parameters):
+        return {"when": datetime.datetime(2024, 11, 5)}
+    
+    server = MCPServer()
+    monkeypatch.setattr(server.tools["helloworld"], "execute", execute)
+    client = TestClient(server.create_app())
+    server.initialized = True
+    
+    response = client.post("/", json={
+        "jsonrpc": "2.0",
+        "method": "tools/call",
+        "params": {"name": "helloworld"},
+        "id": 7
+    })
+    data = response.json()
+    
+    assert data["id"] == 7
+    assert data["result"]["structuredContent"] == {"when": "2024-11-05T00:00:00"}
+
+def test_unserializable_result_does_not_fail_batch(monkeypatch):
+    """Test a response that cannot be serialized only fails its own batch entry."""
+    def format_tool_result(tool_result, **kwargs):
+        return {"content": [{"type": "text", "text": object()}], "isError": False}
+    
+    server = MCPServer()
+    monkeypatch.setattr(sys.modules[MCPServer.__module__], "format_tool_result", format_tool_result)
+    client = TestClient(server.create_app())
+    server.initialized = True
+    
+    response = client.post("/", json=[
+        {"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "helloworld"}, "id": 1},
+        {"jsonrpc": "2.0", "method": "ping", "id": 2}
+    ])
+    failed, ping = response.json()
+    
+    assert failed["id"] == 1
+    assert failed["error"]["code"] == -32603
+    assert ping == {"jsonrpc": "2.0", "result": {}, "id": 2}
+
+def test_notification_gets_no_response(client):
+    """Test a notification is accepted without a response body."""
+    response = client.post("/", json={"jsonrpc": "2.0", "method": "notifications/initialized"})
+    assert response.status_code == 202
+    assert response.content == b""
+
+def test_notification_handler_is_called():
+    """Test registered notification handlers receive params."""
+    server = MCPServer()
+    received = []
+    
+    async def handler(params):
+        received.append(params)
+    
+    server.register_notification_handler("notifications/message", handler)
+    client = TestClient(server.create_app())
+    client.post("/", json={"jsonrpc": "2.0", "method": "notifications/message", "params": {"level": "info"}})
+    
+    assert received == [{"level": "info"}]
+
+def test_notification_only_batch(client):
+    """Test a batch made only of notifications gets an empty 202."""
+    response = client.post("/", json=[
+        {"jsonrpc": "2.0", "method": "notifications/message"},
+        {"jsonrpc": "2.0", "method": "ping"}
+    ])
+    assert response.status_code == 202
+    assert response.content == b""
+
+def test_mixed_batch_omits_notifications(client):
+    """Test only requests with an id get responses in a mixed batch."""
+    response = client.post("/", json=[
+        {"jsonrpc": "2.0", "method": "notifications/message"},
+        {"jsonrpc": "2.0", "method": "ping", "id": 7}
+    ])
+    assert response.json() == [{"jsonrpc": "2.0", "result": {}, "id": 7}]
+
+def test_empty_batch_is_invalid(client):
+    """Test an empty batch is rejected as an invalid request."""
+    response = client.post("/", json=[])
+    assert response.json()["error"]["code"] == -32600
+
+@pytest.fixture
+def initialized_server():
+    server = MCPServer()
+    server.initialized = True
+    return server
+
+def test_prompts_list(initialized_server):
+    """Test prompts/list serves prompt metadata."""
+    client = TestClient(initialized_server.create_app())
+    response = client.post("/", json={"jsonrpc": "2.0", "method": "prompts/list", "id": 10})
+    prompts = response.json()["result"]["prompts"]
+    
+    greeting = next(prompt for prompt in prompts if prompt["name"] == "greeting")
+    assert greeting["arguments"][0] == {"name": "name", "description": "Name of the person to greet", "required": True}
+
+def test_prompts_get_uses_cache(initialized_server):
+    """Test prompts/get renders once per distinct argument set."""
+    client = TestClient(initialized_server.create_app())
+    request = {
+        "jsonrpc": "2.0",
+        "method": "prompts/get",
+        "params": {"name": "greeting", "arguments": {"name": "Ada"}},
+        "id": 11
+    }
+    
+    first = client.post("/", json=request).json()["result"]
+    second = client.post("/", json=request).json()["result"]
+    
+    assert first == second
+    assert first["messages"][0]["content"]["text"] == "Write a short, friendly greeting for Ada."
+    assert len(initialized_server.prompt_cache) == 1
+
+def test_prompts_get_defaults_share_cache_entry(initialized_server):
+    """Test omitted and explicit default arguments hit the same cache entry."""
+    client = TestClient(initialized_server.create_app())
+    for arguments in ({"name": "Ada"}, {"name": "Ada", "tone": "friendly"}):
+        client.post("/", json={
+            "jsonrpc": "2.0",
+            "method": "prompts/get",
+            "params": {"name": "greeting", "arguments": arguments},
+            "id": 13
+        })
+    
+    assert len(initialized_server.prompt_cache) == 1
+
+def test_prompts_get_render_failure_is_internal_error(initialized_server, monkeypatch):
+    """Test non-validation render failures are reported as internal errors."""
+    def render_validated(values):
+        raise RuntimeError("boom")
+    
+    monkeypatch.setattr(initialized_server.prompts["greeting"], "render_validated", render_validated)
+    client = TestClient(initialized_server.create_app())
+    response = client.post("/", json={
+        "jsonrpc": "2.0",
+        "method": "prompts/get",
+        "params": {"name": "greeting", "arguments": {"name": "Ada"}},
+        "id": 14
+    })
+    
+    assert response.json()["error"]["code"] == -32603
+
+def test_prompts_get_missing_argument(initialized_server):
+    """Test prompts/get rejects missing required arguments."""
+    client = TestClient(initialized_server.create_app())
+    response = client.post("/", json={
+        "jsonrpc": "2.0",
+        "method": "prompts/get",
+        "params": {"name": "greeting"},
+        "id": 12
+    })
+    assert response.json()["error"]["code"] == -32602
+    assert len(initialized_server.prompt_cache) == 0
+
+def test_register_resource_closes_replaced(tmp_path):
+    """Test replacing a registered resource closes the old one."""
+    path = tmp_path / "a.txt"
+    path.write_text("abc")
+    server = MCPServer()
+    old = FileResource(str(path))
+    old.read_range(0)
+    server.register_resource(old)
+    
+    server.register_resource(FileResource(str(path)))
+    
+    assert old._map is None
+
+def test_notification_handler_failure_is_counted():
+    """Test failing notification handlers are counted instead of raising."""
+    server = MCPServer()
+    
+    async def handler(params):
+        raise RuntimeError("boom")
+    
+    server.register_notification_handler("notifications/message", handler)
+    client = TestClient(server.create_app())
+    response = client.post("/", json={"jsonrpc": "2.0", "method": "notifications/message"})
+    
+    assert response.status_code == 202
+    assert server.notification_stats["failed"] == 1
+
+def test_request_method_without_id_is_not_dispatched(monkeypatch):
+    """Test regular methods sent as notifications are ignored."""
+    server = MCPServer()
+    server.initialized = True
+    calls = []
+    
+    async def execute(parameters):
+        calls.append(parameters)
+        return "ok"
+    
+    monkeypatch.setattr(server.tools["helloworld"], "execute", execute)
+    client = TestClient(server.create_app())
+    response = client.post("/", json={"jsonrpc": "2.0", "method": "tools/call", "params": {"name": "helloworld"}})
+    
+    assert response.status_code == 202
+    assert calls == []
+    assert server.notification_stats["ignored"] == 1
+
+def test_batch_with_invalid_element(client):
+    """Test a non-object batch element gets its own Invalid Request error."""
+    response = client.post("/", json=[1, {"jsonrpc": "2.0", "method": "ping", "id": 1}])
+    data = response.json()
+    
+    assert data[0]["error"]["code"] == -32600
+    assert data[1] == {"jsonrpc": "2.0", "result": {}, "id": 1}